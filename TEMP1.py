@@ -1,16 +1,35 @@
 #!/usr/bin/env python3
 # aba1.py
+#
+# Con PROCESOS > 1 los ficheros grandes se trocean en bloques alineados a fin de
+# línea que se analizan en paralelo; los resultados se juntan en el orden original
+# y se escriben por lotes, con la misma salida que el modo secuencial.
 
+import mmap
+import multiprocessing
+import os
 import re
 import sys
 
+from lineas_aba import es_ascii_simple, trozos
+from vistos_aba import VistosABA
+
 # ─── CONFIGURACIÓN ─────────────────────────────────────────────────────────────
 FICHERO         = "ruta/al/fichero1.txt"  # Ruta al fichero de texto de entrada
 SHOW_DUPLICATES = False                  # True: muestra duplicados; False: omite duplicados
+PROCESOS        = os.cpu_count() or 1    # Procesos para analizar el fichero; 1: modo secuencial
 # ────────────────────────────────────────────────────────────────────────────────
 
 # Patrón para extraer el ABA: tres espacios, 'ABA', tres espacios, seguido de 9 dígitos
 PATRON_ABA = re.compile(r"\s{3}ABA\s{3}(\d{9})")
+# Sin los tres espacios iniciales el patrón empieza por un literal y la búsqueda es
+# varias veces más rápida; el modo paralelo comprueba esos espacios a mano
+PATRON_CUERPO = re.compile(r"ABA\s{3}(\d{9})")
+PATRON_CUERPO_BYTES = re.compile(PATRON_CUERPO.pattern.encode("ascii"))
+
+# Tamaño mínimo de cada trozo del modo paralelo; los ficheros menores de dos
+# trozos se procesan en secuencial, donde arrancar procesos no compensa
+_TROZO = 4 << 20
 
 def extrae_aba1(fichero: str, show_dups: bool):
     """
@@ -18,7 +37,7 @@ def extrae_aba1(fichero: str, show_dups: bool):
     '   ABA   123456789' y extrae los 9 dígitos. Ignora líneas sin coincidencias.
     Si show_dups es False, omite valores repetidos.
     """
-    vistos = set()
+    vistos = VistosABA()
     try:
         with open(fichero, encoding="utf-8") as f:
             for linea in f:
@@ -31,5 +50,68 @@ def extrae_aba1(fichero: str, show_dups: bool):
         print(f"ERROR: No se encontró el fichero '{fichero}'.", file=sys.stderr)
         sys.exit(1)
 
+def abas_bloque(texto):
+    """
+    ABA de un bloque de líneas completas (bytes ASCII simples o str), con el mismo
+    resultado que extrae_aba1 línea a línea pero con un solo finditer: se exigen los
+    tres espacios previos y se descartan las coincidencias que cruzan un salto de línea.
+    """
+    en_bytes = isinstance(texto, bytes)
+    patron = PATRON_CUERPO_BYTES if en_bytes else PATRON_CUERPO
+    saltos = (b"\n", b"\r") if en_bytes else ("\n", "\r")
+    for match in patron.finditer(texto):
+        inicio = match.start() - 3
+        espacios = texto[inicio:match.start(1)]
+        if inicio < 0 or not texto[inicio:match.start()].isspace() \
+                or saltos[0] in espacios or saltos[1] in espacios:
+            continue
+        aba = match.group(1)
+        yield aba.decode("ascii") if en_bytes else aba
+
+def analiza_trozo(args):
+    """ABA del trozo [start, end) del fichero, en orden (proceso hijo)."""
+    fichero, start, end, show_dups = args
+    with open(fichero, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        bloque = buf[start:end]
+    texto = bloque if es_ascii_simple(bloque) else bloque.decode("utf-8")
+    if show_dups:
+        return list(abas_bloque(texto))
+    # Primer filtro de duplicados dentro del trozo: menos datos de vuelta al padre
+    return list(dict.fromkeys(abas_bloque(texto)))
+
+def extrae_aba1_paralelo(fichero: str, show_dups: bool, procesos: int = PROCESOS):
+    """
+    Como extrae_aba1, repartiendo el fichero en trozos entre 'procesos' procesos.
+    Los trozos se juntan en orden y los duplicados se filtran globalmente, así que
+    la salida es idéntica; se escribe por lotes, un write por trozo.
+    """
+    try:
+        tam = os.path.getsize(fichero)
+    except OSError:
+        print(f"ERROR: No se encontró el fichero '{fichero}'.", file=sys.stderr)
+        sys.exit(1)
+    if procesos <= 1 or tam < 2 * _TROZO:
+        extrae_aba1(fichero, show_dups)
+        return
+
+    # Varios trozos por proceso para repartir bien la carga
+    paso = max(_TROZO, tam // (procesos * 4))
+    with open(fichero, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        tareas = [(fichero, inicio, fin, show_dups) for inicio, fin in trozos(buf, 0, paso)]
+
+    vistos = VistosABA()
+    with multiprocessing.Pool(procesos) as pool:
+        for abas in pool.imap(analiza_trozo, tareas):
+            if not show_dups:
+                nuevos = [aba for aba in abas if aba not in vistos]
+                vistos.update(nuevos)
+                abas = nuevos
+            if abas:
+                sys.stdout.write("\n".join(abas) + "\n")
+    sys.stdout.flush()
+
 if __name__ == "__main__":
-    extrae_aba1(FICHERO, SHOW_DUPLICATES)
+    if PROCESOS > 1:
+        extrae_aba1_paralelo(FICHERO, SHOW_DUPLICATES)
+    else:
+        extrae_aba1(FICHERO, SHOW_DUPLICATES)
@@ -11,48 +11,59 @@ Script avanzado para extraer pares ABA;BIC de un fichero:
 3. Imprime cada pareja en formato: ABA;BIC (o ABA; si no hay BIC).
 4. Controla duplicados basados en ABA según SHOW_DUPLICATES.
 Soporta ficheros en UTF-8 (con o sin BOM) o Latin-1.
+
+Con PROCESOS > 1 los ficheros grandes se trocean en bloques alineados a fin de
+línea que se analizan en paralelo; los resultados se juntan en el orden original
+y se escriben por lotes, con la misma salida que el modo secuencial.
+
+Con STREAMING = True el fichero se mapea en memoria (mmap) y se recorre línea a
+línea sobre bytes; solo se decodifican el ABA y el BIC encontrados, así que la
+memoria no crece con el tamaño del fichero. La salida es idéntica a la del modo clásico.
 """
+import mmap
+import multiprocessing
+import os
 import re
 import sys
 
+from lineas_aba import codificacion_lineas, es_ascii_simple, read_lines, stream_lines, trozos
+from vistos_aba import VistosABA
+
 # ─── CONFIGURACIÓN ─────────────────────────────────────────────────────────────
 FICHERO = "ruta/al/fichero.txt"  # Ruta al fichero de texto de entrada
 SHOW_DUPLICATES = False           # True: muestra todos los pares; False: omite ABA repetidos
+STREAMING = True                  # True: lee con mmap sin cargar el fichero; False: read_lines
+PROCESOS = os.cpu_count() or 1    # Procesos para analizar el fichero; 1: modo secuencial
 # ────────────────────────────────────────────────────────────────────────────────
 
 # Patrón para identificar ABA: 3 espacios + 'ABA' + 3 espacios + 9 dígitos
 PATRON_ABA = re.compile(r"\s{3}ABA\s{3}(\d{9})")
+# El mismo patrón sobre bytes, para las líneas ASCII del modo STREAMING
+PATRON_ABA_BYTES = re.compile(PATRON_ABA.pattern.encode("ascii"))
+# Sin los tres espacios iniciales el patrón empieza por un literal y la búsqueda es
+# varias veces más rápida; el modo paralelo comprueba esos espacios a mano
+PATRON_CUERPO = re.compile(r"ABA\s{3}(\d{9})")
+# En bytes ASCII el BIC también sale del patrón, en una búsqueda anticipada para no
+# consumirlo (puede contener otro ABA): espacios sin salto de línea y, si sigue
+# una letra, hasta 11 caracteres sin pasar del final de la línea
+PATRON_CUERPO_BYTES = re.compile(rb"ABA\s{3}(\d{9})(?=[ \t\x0b\x0c]*([A-Za-z][^\n\r]{0,10})|)")
 
 
-def read_lines(filepath: str):
-    """
-    Lee todas las líneas de un fichero usando utf-8-sig (eliminando BOM) o Latin-1.
-    Devuelve una lista de líneas sin salto final.
-    """
-    for enc in ("utf-8-sig", "latin-1"):
-        try:
-            with open(filepath, encoding=enc) as f:
-                return [line.rstrip("\n") for line in f]
-        except UnicodeDecodeError:
-            continue
-        except FileNotFoundError:
-            print(f"ERROR: No se encontró el fichero '{filepath}'", file=sys.stderr)
-            sys.exit(1)
-    print(f"ERROR: No se pudo leer '{filepath}' en utf-8-sig ni latin-1.", file=sys.stderr)
-    sys.exit(1)
-
-
-def extrae_aba11(fichero: str, show_dups: bool):
+def extrae_aba11(fichero: str, show_dups: bool, streaming: bool = STREAMING):
     """
     Extrae de cada línea los pares ABA;BIC y los imprime.
     """
-    vistos = set()
-    lineas = read_lines(fichero)
+    vistos = VistosABA()
+    lineas = stream_lines(fichero) if streaming else read_lines(fichero)
 
     for linea in lineas:
+        en_bytes = isinstance(linea, bytes)
+        patron = PATRON_ABA_BYTES if en_bytes else PATRON_ABA
         # Buscar cada ocurrencia de ABA en la línea
-        for match in PATRON_ABA.finditer(linea):
+        for match in patron.finditer(linea):
             aba = match.group(1)
+            if en_bytes:
+                aba = aba.decode("ascii")
             # Filtrar duplicados
             if not show_dups and aba in vistos:
                 continue
@@ -61,17 +72,121 @@ def extrae_aba11(fichero: str, show_dups: bool):
             # Hacer espacio después del ABA para buscar BIC
             pos = match.end()
             # Saltar espacios
-            while pos < len(linea) and linea[pos].isspace():
+            while pos < len(linea) and linea[pos:pos+1].isspace():
                 pos += 1
 
             bic = ""
             # Si el primer char no espacio es letra, extraer 11 caracteres
-            if pos < len(linea) and linea[pos].isalpha():
+            if pos < len(linea) and linea[pos:pos+1].isalpha():
                 bic = linea[pos:pos+11]
+                if en_bytes:
+                    bic = bic.decode("ascii")
 
             # Imprimir resultado
             print(f"{aba};{bic}")
 
 
+# Tamaño mínimo de cada trozo del modo paralelo; los ficheros menores de dos
+# trozos se procesan en secuencial, donde arrancar procesos no compensa
+_TROZO = 4 << 20
+
+
+def pares_bloque(texto):
+    """
+    Pares (aba, bic) de un bloque de líneas completas (bytes ASCII simples o str),
+    con el mismo resultado que aplicar la lógica de extrae_aba11 línea a línea pero
+    con un solo finditer: se exigen los tres espacios previos, se descartan las
+    coincidencias cuyos espacios cruzan un salto de línea y el BIC no pasa del
+    final de la línea.
+    """
+    en_bytes = isinstance(texto, bytes)
+    saltos = (b"\n", b"\r") if en_bytes else ("\n", "\r")
+    if en_bytes:
+        for match in PATRON_CUERPO_BYTES.finditer(texto):
+            inicio = match.start() - 3
+            espacios = texto[inicio:match.start(1)]
+            if inicio < 0 or not texto[inicio:match.start()].isspace() \
+                    or saltos[0] in espacios or saltos[1] in espacios:
+                continue
+            aba, bic = match.group(1, 2)
+            yield aba.decode("ascii"), bic.decode("ascii") if bic else ""
+        return
+    n = len(texto)
+    for match in PATRON_CUERPO.finditer(texto):
+        inicio = match.start() - 3
+        if inicio < 0 or not texto[inicio:match.start()].isspace():
+            continue
+        espacios = texto[inicio:match.start(1)]
+        if saltos[0] in espacios or saltos[1] in espacios:
+            continue
+        aba = match.group(1)
+        pos = match.end()
+        while pos < n:
+            c = texto[pos:pos+1]
+            if c in saltos or not c.isspace():
+                break
+            pos += 1
+        bic = ""
+        if pos < n and texto[pos:pos+1].isalpha():
+            bic = texto[pos:pos+11].split(saltos[0], 1)[0].split(saltos[1], 1)[0]
+        yield aba, bic
+
+
+def analiza_trozo(args):
+    """
+    ABA y líneas de salida ya formateadas del trozo [start, end) del fichero, en
+    orden (proceso hijo).
+    """
+    fichero, start, end, line_encoding, show_dups = args
+    with open(fichero, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        bloque = buf[start:end]
+    texto = bloque if es_ascii_simple(bloque) else bloque.decode(line_encoding)
+    abas = []
+    lineas = []
+    vistos = set()
+    for aba, bic in pares_bloque(texto):
+        # Primer filtro de duplicados dentro del trozo: menos datos de vuelta al padre
+        if show_dups or aba not in vistos:
+            vistos.add(aba)
+            abas.append(aba)
+            lineas.append(f"{aba};{bic}\n")
+    return abas, lineas
+
+
+def extrae_aba11_paralelo(fichero: str, show_dups: bool, procesos: int = PROCESOS):
+    """
+    Como extrae_aba11, repartiendo el fichero en trozos entre 'procesos' procesos.
+    Los trozos se juntan en orden y los duplicados se filtran globalmente, así que
+    la salida es idéntica; se escribe por lotes, un write por trozo.
+    """
+    try:
+        tam = os.path.getsize(fichero)
+    except OSError:
+        print(f"ERROR: No se encontró el fichero '{fichero}'", file=sys.stderr)
+        sys.exit(1)
+    if procesos <= 1 or tam < 2 * _TROZO:
+        extrae_aba11(fichero, show_dups)
+        return
+
+    with open(fichero, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        line_encoding, start = codificacion_lineas(buf)
+        # Varios trozos por proceso para repartir bien la carga
+        paso = max(_TROZO, tam // (procesos * 4))
+        tareas = [(fichero, inicio, fin, line_encoding, show_dups)
+                  for inicio, fin in trozos(buf, start, paso)]
+
+    vistos = VistosABA()
+    with multiprocessing.Pool(procesos) as pool:
+        for abas, lineas in pool.imap(analiza_trozo, tareas):
+            if not show_dups:
+                lineas = [linea for aba, linea in zip(abas, lineas) if aba not in vistos]
+                vistos.update(abas)
+            sys.stdout.write("".join(lineas))
+    sys.stdout.flush()
+
+
 if __name__ == "__main__":
-    extrae_aba11(FICHERO, SHOW_DUPLICATES)
+    if PROCESOS > 1:
+        extrae_aba11_paralelo(FICHERO, SHOW_DUPLICATES)
+    else:
+        extrae_aba11(FICHERO, SHOW_DUPLICATES)
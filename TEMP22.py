@@ -12,46 +12,43 @@ Script avanzado para extraer ABA y BIC de un fichero basado en posición fija:
 4. Imprime cada pareja en formato: ABA;BIC (o ABA; si no hay BIC).
 5. Control de duplicados basado en ABA según SHOW_DUPLICATES.
 Soporta ficheros en UTF-8 (con BOM) o Latin-1.
+
+Con STREAMING = True el fichero se mapea en memoria (mmap) y se recorre línea a
+línea sobre bytes: los campos en SKIP_CHARS/BIC_POS se cortan directamente del
+buffer y solo se decodifican esos 9 y 11 bytes, así que la memoria no crece con el
+tamaño del fichero. La salida es idéntica a la del modo clásico.
 """
 import sys
 
+from lineas_aba import read_lines, stream_lines
+from vistos_aba import VistosABA
+
 # ─── CONFIGURACIÓN ─────────────────────────────────────────────────────────────
 FICHERO         = "ruta/al/fichero.txt"  # Ruta al fichero de texto de entrada
 SKIP_CHARS      = 499                    # Posición inicial (0-based) para extraer ABA
 FIELD_LENGTH    = 9                      # Longitud de los 9 dígitos del ABA
 BIC_POS         = 743                    # Posición fija (0-based) donde empieza el BIC
 SHOW_DUPLICATES = False                  # True: muestra duplicados; False: omite ABA repetidos
+STREAMING       = True                   # True: lee con mmap sin cargar el fichero; False: read_lines
 # ────────────────────────────────────────────────────────────────────────────────
 
-def read_lines(filepath: str):
-    """
-    Lee todas las líneas de un fichero usando utf-8-sig (eliminando BOM) o Latin-1.
-    Devuelve una lista de líneas sin salto final.
-    """
-    for enc in ("utf-8-sig", "latin-1"):
-        try:
-            with open(filepath, encoding=enc) as f:
-                return [line.rstrip("\n") for line in f]
-        except UnicodeDecodeError:
-            continue
-        except FileNotFoundError:
-            print(f"ERROR: No se encontró el fichero '{filepath}'", file=sys.stderr)
-            sys.exit(1)
-    print(f"ERROR: No se pudo leer '{filepath}' en utf-8-sig ni latin-1.", file=sys.stderr)
-    sys.exit(1)
 
-def extrae_aba2(fichero: str, skip_chars: int, field_len: int, bic_pos: int, show_dups: bool):
+def extrae_aba2(fichero: str, skip_chars: int, field_len: int, bic_pos: int, show_dups: bool,
+                streaming: bool = STREAMING):
     """
     Extrae ABA y BIC de cada línea y los imprime en formato ABA;BIC.
     """
-    vistos = set()
-    lineas = read_lines(fichero)
+    vistos = VistosABA()
+    lineas = stream_lines(fichero) if streaming else read_lines(fichero)
 
     for linea in lineas:
         # Omitir los primeros skip_chars caracteres
         if len(linea) <= skip_chars:
             continue
         segmento = linea[skip_chars:skip_chars + field_len]
+        if isinstance(linea, bytes):
+            # Línea ASCII: solo se decodifican los campos
+            segmento = segmento.decode("ascii")
         aba = segmento.strip()
         if not aba:
             continue
@@ -62,8 +59,12 @@ def extrae_aba2(fichero: str, skip_chars: int, field_len: int, bic_pos: int, sho
 
         # Buscar BIC en posición fija
         bic = ""
-        if len(linea) > bic_pos and linea[bic_pos].isalpha():
-            bic = linea[bic_pos:bic_pos + 11]
+        if len(linea) > bic_pos:
+            if isinstance(linea, bytes):
+                if linea[bic_pos:bic_pos + 1].isalpha():
+                    bic = linea[bic_pos:bic_pos + 11].decode("ascii")
+            elif linea[bic_pos].isalpha():
+                bic = linea[bic_pos:bic_pos + 11]
 
         print(f"{aba};{bic}")
 
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+abaCLI.py
+
+Herramienta única de línea de comandos para extraer ABA (y BIC), en lugar de
+editar las constantes de TEMP1, TEMP11, TEMP2 y TEMP22:
+
+  regex  Busca '   ABA   <9 dígitos>' en cualquier parte de la línea (TEMP1);
+         con --bic imprime también el BIC que le sigue (TEMP11).
+  fijo   Registros de posición fija: el ABA está en --skip/--len (TEMP2); con
+         --bic-pos imprime ABA;BIC y omite los ABA vacíos (TEMP22).
+
+En modo fijo, si las líneas miden todas lo mismo, el fichero se ve como una matriz
+de bytes (una fila por registro) y las columnas ABA y BIC, la prueba de letra del
+BIC y el control de duplicados se hacen con NumPy por lotes de filas. Los lotes
+con bytes no ASCII y los ficheros con líneas de distinta longitud siguen la lógica
+línea a línea de los scripts. La salida es la misma que la de los scripts; el modo
+fijo decodifica como TEMP22 (UTF-8 o, si no es válido, Latin-1) y, como TEMP2 lee
+en utf-8, sin --bic-pos un BOM inicial cuenta como un carácter de la primera línea.
+
+Ejemplos:
+    python abaCLI.py regex pagos.txt
+    python abaCLI.py regex pagos.txt --bic --procesos 4
+    python abaCLI.py fijo registros.txt --skip 499 --bic-pos 743
+    python abaCLI.py fijo registros.txt --skip 499 --duplicados > abas.txt
+"""
+import argparse
+import mmap
+import sys
+
+import TEMP1
+import TEMP11
+import TEMP22
+from lineas_aba import codificacion_lineas, es_ascii_simple, libera_paginas, lineas_bloque, lineas_desde
+from vistos_aba import ABA_DIGITOS, VistosABA
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy el modo fijo va siempre línea a línea
+    np = None
+
+LOTE_BYTES = 8 << 20  # Tamaño de cada lote de filas del motor NumPy
+LOTE_FILAS = 1 << 16  # Registros por escritura en el camino línea a línea
+BIC_LEN = 11          # Letra del BIC + los 10 caracteres siguientes
+
+if np is not None:
+    _POTENCIAS = 10 ** np.arange(ABA_DIGITOS - 1, -1, -1, dtype=np.int64)
+
+
+def campos_linea(linea, skip_chars: int, field_len: int, bic_pos):
+    """
+    Reglas de TEMP2 (bic_pos None) y TEMP22 para una línea, en bytes ASCII o str.
+    Devuelve (aba, bic) o None si la línea no da registro; en modo TEMP2 las
+    líneas cortas dan un ABA vacío y bic es None.
+    """
+    if len(linea) <= skip_chars:
+        return ("", None) if bic_pos is None else None
+    segmento = linea[skip_chars:skip_chars + field_len]
+    if isinstance(linea, bytes):
+        segmento = segmento.decode("ascii")
+    aba = segmento.strip()
+    if bic_pos is None:
+        return aba, None
+    if not aba:
+        return None
+    bic = ""
+    if len(linea) > bic_pos:
+        if isinstance(linea, bytes):
+            if linea[bic_pos:bic_pos + 1].isalpha():
+                bic = linea[bic_pos:bic_pos + BIC_LEN].decode("ascii")
+        elif linea[bic_pos].isalpha():
+            bic = linea[bic_pos:bic_pos + BIC_LEN]
+    return aba, bic
+
+
+def filtra_lineas(lineas, skip_chars: int, field_len: int, bic_pos, show_dups: bool, vistos):
+    """
+    Camino línea a línea: escribe los registros de 'lineas' por lotes.
+    """
+    salida = []
+    for linea in lineas:
+        campos = campos_linea(linea, skip_chars, field_len, bic_pos)
+        if campos is None:
+            continue
+        aba, bic = campos
+        if not show_dups:
+            if aba in vistos:
+                continue
+            vistos.add(aba)
+        salida.append(aba if bic is None else f"{aba};{bic}")
+        if len(salida) >= LOTE_FILAS:
+            sys.stdout.write("\n".join(salida) + "\n")
+            salida = []
+    if salida:
+        sys.stdout.write("\n".join(salida) + "\n")
+
+
+def columna(filas, inicio: int, fin: int):
+    """Columnas [inicio, fin) de cada fila como array de bytes (dtype S)."""
+    if fin <= inicio:
+        return np.zeros(len(filas), dtype="S1")
+    return np.ascontiguousarray(filas[:, inicio:fin]).view(f"S{fin - inicio}").ravel()
+
+
+def marca_nuevos(abas, vistos) -> "np.ndarray":
+    """
+    Control de duplicados de un lote: devuelve, en orden, las posiciones de los ABA
+    que no estaban en 'vistos' (primera aparición dentro del lote) y los añade.
+    Mientras VistosABA es un set, solo los valores distintos del lote pasan por
+    Python; con el mapa de bits, los ABA de 9 dígitos se marcan de golpe y el
+    resto (vacíos, longitudes raras) pasa uno a uno por su set.
+    """
+    if vistos.mapa is None:
+        unicos, primeros = np.unique(abas, return_index=True)
+        nuevos = []
+        for valor, i in zip(unicos.tolist(), primeros.tolist()):
+            aba = valor.decode("ascii")
+            if aba not in vistos:
+                vistos.add(aba)
+                nuevos.append(i)
+        return np.sort(np.array(nuevos, dtype=np.intp))
+
+    if abas.dtype.itemsize >= ABA_DIGITOS:
+        digitos = abas.view(np.uint8).reshape(len(abas), -1)[:, :ABA_DIGITOS] - ord("0")
+        es_num = (np.char.str_len(abas) == ABA_DIGITOS) & (digitos < 10).all(axis=1)
+    else:
+        es_num = np.zeros(len(abas), dtype=bool)
+
+    pos_num = np.flatnonzero(es_num)
+    numeros = digitos[pos_num].astype(np.int64) @ _POTENCIAS if len(pos_num) else pos_num
+    unicos, primeros = np.unique(numeros, return_index=True)
+    mapa = np.frombuffer(vistos.mapa, dtype=np.uint8)
+    byte = unicos >> 3
+    mascara = (1 << (unicos & 7)).astype(np.uint8)
+    nuevos = (mapa[byte] & mascara) == 0
+    np.bitwise_or.at(mapa, byte[nuevos], mascara[nuevos])
+    vistos.total += int(nuevos.sum())
+    del mapa  # libera la vista: VistosABA.close() no cierra un mmap exportado
+
+    resto = []
+    for i in np.flatnonzero(~es_num):
+        aba = abas[i].decode("ascii")
+        if aba not in vistos:
+            vistos.add(aba)
+            resto.append(i)
+    return np.sort(np.concatenate([pos_num[primeros[nuevos]], np.array(resto, dtype=np.intp)]))
+
+
+def filtra_matriz(filas, skip_chars: int, field_len: int, bic_pos, show_dups: bool, vistos) -> str:
+    """
+    Versión NumPy de filtra_lineas para un lote de filas ASCII de igual longitud
+    (sin el salto de línea). Devuelve la salida del lote.
+    """
+    ancho = filas.shape[1]
+    if ancho <= skip_chars:
+        if bic_pos is not None:
+            return ""
+        abas = np.zeros(len(filas), dtype="S1")
+    else:
+        abas = np.char.strip(columna(filas, skip_chars, min(skip_chars + field_len, ancho)))
+
+    if bic_pos is None:
+        seleccion = np.arange(len(filas))
+    else:
+        seleccion = np.flatnonzero(np.char.str_len(abas) > 0)
+    if not show_dups:
+        seleccion = seleccion[marca_nuevos(abas[seleccion], vistos)]
+    if not len(seleccion):
+        return ""
+
+    abas = abas[seleccion]
+    if bic_pos is not None:
+        registros = np.char.add(abas, b";")
+        if ancho > bic_pos:
+            filas = filas[seleccion]
+            es_letra = ((filas[:, bic_pos] | 0x20) - ord("a")) < 26
+            bics = columna(filas, bic_pos, min(bic_pos + BIC_LEN, ancho))
+            registros = np.char.add(registros, np.where(es_letra, bics, b""))
+        abas = registros
+    return (b"\n".join(abas.tolist()) + b"\n").decode("ascii")
+
+
+def recorre_matriz(buf, start: int, line_encoding: str, skip_chars: int, field_len: int,
+                   bic_pos, show_dups: bool, vistos) -> int:
+    """
+    Recorre buf desde 'start' por lotes de filas mientras las líneas midan lo mismo
+    que la primera. Devuelve la posición donde se ha parado (fin del fichero, o la
+    primera línea que rompe el ancho fijo) para seguir línea a línea desde ahí.
+    """
+    fin_linea = buf.find(b"\n", start)
+    if fin_linea < 0:
+        return start
+    largo = fin_linea - start + 1
+    crlf = fin_linea > start and buf[fin_linea - 1] == 13
+    saltos = 2 if crlf else 1
+    pos = start
+    while True:
+        n = min(max(1, LOTE_BYTES // largo), (len(buf) - pos) // largo)
+        if not n:
+            break
+        bloque = buf[pos:pos + n * largo]
+        filas = np.frombuffer(bloque, dtype=np.uint8).reshape(n, largo)
+        # Un salto por fila y justo al final: todas las líneas del lote miden 'largo'
+        if (np.count_nonzero(filas == 10) != n or np.count_nonzero(filas == 13) != (n if crlf else 0)
+                or not (filas[:, -1] == 10).all() or (crlf and not (filas[:, -2] == 13).all())):
+            break
+        # NumPy recorta los NUL finales de los campos, así que también van línea a línea
+        if es_ascii_simple(bloque) and b"\x00" not in bloque:
+            sys.stdout.write(filtra_matriz(filas[:, :largo - saltos], skip_chars, field_len,
+                                           bic_pos, show_dups, vistos))
+        else:
+            # Mismo ancho pero con bytes no ASCII o separadores: este lote va línea a línea
+            filtra_lineas(lineas_bloque(bloque, line_encoding),
+                          skip_chars, field_len, bic_pos, show_dups, vistos)
+        libera_paginas(buf, pos, pos + n * largo)
+        pos += n * largo
+    return pos
+
+
+def extrae_fijo(fichero: str, skip_chars: int, field_len: int, bic_pos, show_dups: bool,
+                vectorizado: bool = True):
+    """
+    Modo fijo: TEMP2 si bic_pos es None, TEMP22 si no. Con NumPy y vectorizado=True
+    usa el motor por lotes mientras el fichero sea de ancho fijo.
+    """
+    vistos = VistosABA()
+    try:
+        try:
+            f = open(fichero, "rb")
+        except FileNotFoundError:
+            print(f"ERROR: No se encontró el fichero '{fichero}'", file=sys.stderr)
+            sys.exit(1)
+        with f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # fichero vacío
+                return
+            with buf:
+                line_encoding, start = codificacion_lineas(buf)
+                if start and bic_pos is None:
+                    # TEMP2 lee con utf-8 (no utf-8-sig): el BOM queda como '\ufeff' al
+                    # principio de la primera línea y desplaza sus columnas un carácter
+                    fin = buf.find(b"\n") + 1 or len(buf)
+                    filtra_lineas(lineas_bloque(buf[:fin], line_encoding),
+                                  skip_chars, field_len, bic_pos, show_dups, vistos)
+                    start = fin
+                if vectorizado and np is not None:
+                    start = recorre_matriz(buf, start, line_encoding, skip_chars, field_len,
+                                           bic_pos, show_dups, vistos)
+                # Sin NumPy, cola sin salto final o fichero irregular: lógica de siempre
+                filtra_lineas(lineas_desde(buf, start, line_encoding),
+                              skip_chars, field_len, bic_pos, show_dups, vistos)
+    finally:
+        sys.stdout.flush()
+        vistos.close()
+
+
+def extrae_regex(fichero: str, bic: bool, show_dups: bool, procesos: int):
+    """Modo regex: TEMP11 con --bic, TEMP1 sin él (en paralelo si procesos > 1)."""
+    if bic:
+        TEMP11.extrae_aba11_paralelo(fichero, show_dups, procesos)
+    else:
+        TEMP1.extrae_aba1_paralelo(fichero, show_dups, procesos)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extrae ABA (y BIC) de un fichero de texto.")
+    modos = parser.add_subparsers(dest="modo", required=True)
+
+    regex = modos.add_parser("regex", help="Busca '   ABA   <9 dígitos>' en cada línea (TEMP1/TEMP11)")
+    regex.add_argument("fichero", help="Fichero de texto de entrada")
+    regex.add_argument("--bic", action="store_true", help="Imprime ABA;BIC con el BIC que sigue al ABA (TEMP11)")
+    regex.add_argument("-p", "--procesos", type=int, default=TEMP1.PROCESOS,
+                       help="Procesos para ficheros grandes (1: secuencial)")
+
+    fijo = modos.add_parser("fijo", help="Registros de posición fija (TEMP2/TEMP22)")
+    fijo.add_argument("fichero", help="Fichero de texto de entrada")
+    fijo.add_argument("--skip", type=int, default=TEMP22.SKIP_CHARS,
+                      help="Posición (0-based) donde empieza el ABA")
+    fijo.add_argument("--len", type=int, default=TEMP22.FIELD_LENGTH, dest="field_len",
+                      help="Longitud del campo ABA")
+    fijo.add_argument("--bic-pos", type=int, help="Posición (0-based) del BIC; imprime ABA;BIC (TEMP22)")
+    fijo.add_argument("--por-lineas", action="store_true", help="No usar el motor NumPy")
+
+    for sub in (regex, fijo):
+        sub.add_argument("-d", "--duplicados", action="store_true", help="Muestra también los ABA repetidos")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.modo == "regex":
+        extrae_regex(args.fichero, args.bic, args.duplicados, args.procesos)
+    else:
+        extrae_fijo(args.fichero, args.skip, args.field_len, args.bic_pos, args.duplicados,
+                    vectorizado=not args.por_lineas)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: abaCLI fixed-width mode (NumPy engine) vs the TEMP2/TEMP22 scripts.
+
+Usage:
+    python benchmarks/bench_aba_cli.py [--records N] [--distinct D] [--repeat R]
+
+A fixed-width file of N records (D distinct routing numbers, ABA at 499 and BIC
+at 743, like the scripts' defaults) is generated, then each variant runs with and
+without duplicates:
+
+    TEMP2.extrae_aba / TEMP22.extrae_aba2    the current scripts
+    abaCLI --por-lineas                      the CLI's per-line fallback
+    abaCLI                                   the vectorized engine
+
+Outputs must be identical to the scripts' (exit status 1 otherwise). A ragged
+copy of the file (one short line in the middle) checks the fallback too.
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from importlib.machinery import SourceFileLoader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import abaCLI  # noqa: E402
+
+SKIP, FIELD, BIC_POS = 499, 9, 743
+
+
+def load(name, filename):
+    path = os.path.join(ROOT, filename)
+    # Explicit loader: TEMP2.PY's upper-case extension is not recognised as source
+    spec = importlib.util.spec_from_file_location(name, path, loader=SourceFileLoader(name, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_file(path, records, distinct, seed=0, ragged=False):
+    rnd = random.Random(seed)
+    pool = [f"{rnd.randrange(10 ** 9):09d}" for _ in range(distinct)] + ["", "12345"]
+    bics = ["BOFAUS3NXXX", "CHASUS33   ", "           ", "12345678901"]
+    filler = "x" * SKIP
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for i in range(records):
+            if ragged and i == records // 2:
+                f.write("short line\n")
+            f.write(filler + rnd.choice(pool).ljust(FIELD) + " " * (BIC_POS - SKIP - FIELD)
+                    + rnd.choice(bics) + " " * 45 + "\n")
+
+
+def timed(func, *args):
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        func(*args)
+    return time.perf_counter() - start, out.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=500_000)
+    parser.add_argument("--distinct", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    temp2 = load("TEMP2", "TEMP2.PY")
+    temp22 = load("TEMP22", "TEMP22.py")
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fixed.txt")
+        write_file(path, args.records, args.distinct)
+        ragged = os.path.join(tmp, "ragged.txt")
+        write_file(ragged, 20_000, 5_000, seed=1, ragged=True)
+        print(f"{args.records:,} records, {args.distinct:,} distinct, "
+              f"{os.path.getsize(path) / 2 ** 20:.0f} MB")
+
+        for dups in (False, True):
+            print(f"show duplicates: {dups}")
+            groups = [
+                (("TEMP2.extrae_aba", temp2.extrae_aba, (SKIP, FIELD, dups)), None),
+                (("TEMP22.extrae_aba2", temp22.extrae_aba2, (SKIP, FIELD, BIC_POS, dups)), BIC_POS),
+            ]
+            for script, bic_pos in groups:
+                flag = " --bic-pos" if bic_pos is not None else ""
+                variants = [
+                    script,
+                    (f"abaCLI fijo{flag} --por-lineas", abaCLI.extrae_fijo, (SKIP, FIELD, bic_pos, dups, False)),
+                    (f"abaCLI fijo{flag}", abaCLI.extrae_fijo, (SKIP, FIELD, bic_pos, dups, True)),
+                ]
+                baseline = expected = None
+                for label, func, rest in variants:
+                    best = float("inf")
+                    for _ in range(args.repeat):
+                        seconds, out = timed(func, path, *rest)
+                        best = min(best, seconds)
+                    if baseline is None:
+                        baseline, expected = best, out
+                    same = out == expected
+                    ok = ok and same
+                    print(f"  {'ok' if same else 'FAIL':<4} {label:<36} {best:8.3f} s"
+                          f"  {baseline / best:5.1f}x  ({out.count(chr(10)):,} lines)")
+
+        print("ragged file:")
+        for label, script, rest in [("TEMP2", temp2.extrae_aba, (SKIP, FIELD, False)),
+                                    ("TEMP22", temp22.extrae_aba2, (SKIP, FIELD, BIC_POS, False))]:
+            bic_pos = BIC_POS if label == "TEMP22" else None
+            same = timed(script, ragged, *rest)[1] == timed(abaCLI.extrae_fijo, ragged, SKIP, FIELD,
+                                                             bic_pos, False, True)[1]
+            ok = ok and same
+            print(f"  {'ok' if same else 'FAIL':<4} {label}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark: set() of str vs VistosABA for the ABA duplicate filter.
+
+Usage:
+    python benchmarks/bench_aba_dedup.py [--keys N] [--distinct D]
+
+1. Memory and throughput: N routing numbers (D distinct) go through the same
+   'if aba not in vistos: vistos.add(aba)' loop the scripts use, with set(),
+   VistosABA (set up to UMBRAL_MAPA distinct values, then the bitmap) and the
+   bitmap from the start. Each one runs in its own child process, so the RSS
+   growth is measured cleanly. Try --distinct 20000 and --distinct 2000000.
+2. Output check: extrae_aba (TEMP2), extrae_aba1 (TEMP1), extrae_aba11 (TEMP11)
+   and extrae_aba2 (TEMP22) are run on generated files with set(), with the
+   bitmap and with a VistosABA that switches halfway, and their outputs must be
+   identical (exit status 1 otherwise).
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from functools import partial
+from importlib.machinery import SourceFileLoader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from vistos_aba import VistosABA  # noqa: E402
+
+
+def rss_mb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def run_variant(variant, n, distinct, seed=0):
+    """Child process: dedup n keys with one structure, print 'seconds rss_mb distinct'."""
+    rnd = random.Random(seed)
+    pool = [rnd.randrange(10 ** 9) for _ in range(distinct)]
+    picks = [rnd.randrange(distinct) for _ in range(n)]
+    before = rss_mb()
+    vistos = {"set": set, "adaptive": VistosABA, "bitmap": partial(VistosABA, umbral=0)}[variant]()
+    start = time.perf_counter()
+    for i in picks:
+        # A fresh str per record, as the scripts get from slicing or the regex
+        aba = f"{pool[i]:09d}"
+        if aba not in vistos:
+            vistos.add(aba)
+    seconds = time.perf_counter() - start
+    print(seconds, rss_mb() - before, len(vistos))
+
+
+def load(name, filename):
+    path = os.path.join(ROOT, filename)
+    # Explicit loader: TEMP2.PY's upper-case extension is not recognised as source
+    spec = importlib.util.spec_from_file_location(name, path, loader=SourceFileLoader(name, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def output_of(func, *args):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        func(*args)
+    return out.getvalue()
+
+
+def check_outputs(tmp):
+    rnd = random.Random(1)
+    pool = [f"{rnd.randrange(10 ** 9):09d}" for _ in range(2000)] + ["12345", "", "٣٣٣٣٣٣٣٣٣"]
+    fixed = os.path.join(tmp, "fixed.txt")
+    with open(fixed, "w", encoding="utf-8") as f:
+        for _ in range(20000):
+            aba = rnd.choice(pool).ljust(9)
+            bic = rnd.choice(["BOFAUS3NXXX", "           ", "12345678901"])
+            f.write("x" * 499 + aba + " " * 235 + bic + "\n")
+    tagged = os.path.join(tmp, "tagged.txt")
+    with open(tagged, "w", encoding="utf-8") as f:
+        for _ in range(20000):
+            f.write(f"PAGO   ABA   {rnd.choice(pool)}   {rnd.choice(['CHASUS33XXX', '1'])}\n")
+
+    cases = [
+        ("TEMP2.PY", "extrae_aba", (fixed, 499, 9, False)),
+        ("TEMP22.py", "extrae_aba2", (fixed, 499, 9, 743, False)),
+        ("TEMP1.py", "extrae_aba1", (tagged, False)),
+        ("TEMP11.py", "extrae_aba11", (tagged, False)),
+    ]
+    ok = True
+    for filename, func, args in cases:
+        module = load(os.path.splitext(filename)[0], filename)
+        module.VistosABA = set
+        expected = output_of(getattr(module, func), *args)
+        for label, variant in (("bitmap", partial(VistosABA, umbral=0)), ("switch", partial(VistosABA, umbral=1000))):
+            module.VistosABA = variant
+            got = output_of(getattr(module, func), *args)
+            same = got == expected
+            ok = ok and same
+            print(f"  {'ok' if same else 'FAIL':<4} {filename:<10} {func:<13} {label:<7} {got.count(chr(10))} lines")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=5_000_000)
+    parser.add_argument("--distinct", type=int, default=2_000_000)
+    parser.add_argument("--variant", choices=["set", "adaptive", "bitmap"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.variant:
+        run_variant(args.variant, args.keys, args.distinct)
+        return
+
+    print(f"{args.keys:,} keys, {args.distinct:,} distinct:")
+    for variant in ("set", "adaptive", "bitmap"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--variant", variant, "--keys", str(args.keys),
+             "--distinct", str(args.distinct)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        seconds, mb, distinct = float(out[0]), float(out[1]), int(out[2])
+        label = {"set": "set()", "adaptive": "VistosABA", "bitmap": "bitmap"}[variant]
+        print(f"  {label:<10} {seconds:8.2f} s  {seconds / args.keys * 1e9:6.0f} ns/key"
+              f"  {mb:8.1f} MB  ({mb * 1024 * 1024 / max(distinct, 1):.1f} bytes/distinct)")
+
+    print("Output check:")
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = check_outputs(tmp)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Offline crawl benchmark: the real strategy chain against local synthetic sites.
+
+Usage:
+    python benchmarks/bench_crawl.py [--sites N] [--workers W] [--kinds home,js,...]
+                                     [--lean] [--no-http-first] [--slow S]
+                                     [--report run.json] [--baseline previous.json]
+
+synthetic_sites.py serves N sites of every kind (homepage, /contact only, mailto,
+obfuscated, slow, 404, JS-rendered, Facebook-only, Google-only, none) plus the
+Facebook and Google stand-ins. crawl_stream then runs against it with headless
+Chrome (must be installed) and the HTTP tier, both through the local server as a
+proxy, so nothing leaves the machine and every run sees the same sites. The js,
+missing and google kinds are only reachable through the browser (strategies 6 and
+7 never use the HTTP tier), so without a working Chrome they come back empty.
+
+The report gives sites/min, how many expected addresses were found per kind,
+per-strategy attempts, hit rate and latency (avg/p50/p95/max), and the peak RSS
+of this process plus its browsers. --report saves it as JSON and --baseline
+prints the change against an earlier report.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import emailcrawlerGUI  # noqa: E402
+from emailcrawlerGUI import STRATEGIES, CrawlMetrics, DriverManager, crawl_stream, iniciar_driver  # noqa: E402
+from synthetic_sites import KINDS, SLOW_SECONDS, SyntheticSites, expected_email, site_host, site_kind  # noqa: E402
+
+try:
+    import psutil
+except ImportError:  # without psutil only this process's own peak is known (no browsers)
+    psutil = None
+
+
+class PeakRss:
+    """Samples the RSS of this process and all its children in a background thread."""
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def sample(self):
+        if psutil is None:
+            import resource
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        me = psutil.Process()
+        total = 0
+        for proc in [me] + me.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.peak_mb = max(self.peak_mb, self.sample())
+            self.stopped.wait(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        self.peak_mb = max(self.peak_mb, self.sample())
+        return self.peak_mb
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def run(args):
+    kinds = [k.strip() for k in args.kinds.split(",")] if args.kinds else KINDS
+    websites = [f"http://{site_host(n, kinds)}" for n in range(args.sites)]
+    server = SyntheticSites(slow_seconds=args.slow)
+    # Strategies 6 and 7 go to the local stand-ins instead of Facebook and Google
+    emailcrawlerGUI.FACEBOOK_URL = "http://facebook.test/{name}"
+    emailcrawlerGUI.GOOGLE_SEARCH_URL = "http://google.test/search?q={query}"
+
+    rss = PeakRss()
+    metrics = CrawlMetrics(keep_sites=True)
+    per_kind = {kind: {"sites": 0, "found": 0, "expected_found": 0, "errors": 0} for kind in kinds}
+    lock = threading.Lock()
+
+    def on_result(idx, website, result, error):
+        host = website.split("//", 1)[1]
+        emails = {email.lower() for email, _ in result or []}
+        with lock:
+            stats = per_kind[site_kind(host)[1]]
+            stats["sites"] += 1
+            stats["found"] += 1 if emails else 0
+            stats["expected_found"] += 1 if expected_email(host) in emails else 0
+            stats["errors"] += 1 if error else 0
+
+    drivers = DriverManager(headless=True, lean=args.lean, factory=partial(iniciar_driver, proxy=server.proxy))
+    try:
+        # Browsers are started before the clock so the cold start is reported on its own
+        start = time.perf_counter()
+        drivers.prewarm(args.workers)
+        for driver in [drivers.acquire() for _ in range(args.workers)]:
+            drivers.release(driver)
+        startup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        crawl_stream(websites, args.workers, headless=True, show_all=True, on_result=on_result,
+                     http_first=not args.no_http_first, lean=args.lean, metrics=metrics,
+                     drivers=drivers, proxy=server.proxy)
+        elapsed = time.perf_counter() - start
+    finally:
+        drivers.close()
+        peak = rss.stop()
+        requests = server.requests
+        server.close()
+
+    summary = metrics.summary()
+    latencies = {}
+    for record in summary["site_records"]:
+        latencies.setdefault(record["strategy"], []).append(record["seconds"])
+    strategies = {}
+    for name in STRATEGIES:
+        stats = summary["strategies"].get(name, {})
+        seconds = latencies.get(name, [])
+        strategies[name] = {
+            "attempts": stats.get("attempts", 0),
+            "hits": stats.get("hits", 0),
+            "hit_rate": stats.get("hit_rate", 0.0),
+            "avg_seconds": stats.get("avg_seconds", 0.0),
+            "p50_seconds": percentile(seconds, 0.5),
+            "p95_seconds": percentile(seconds, 0.95),
+            "max_seconds": stats.get("max_seconds", 0.0),
+        }
+    expected = sum(stats["sites"] for kind, stats in per_kind.items() if kind != "none")
+    return {
+        "config": {"sites": args.sites, "workers": args.workers, "kinds": kinds, "lean": args.lean,
+                   "http_first": not args.no_http_first, "slow_seconds": args.slow},
+        "startup_seconds": round(startup, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        "sites_per_min": round(args.sites / elapsed * 60, 2) if elapsed else 0.0,
+        "peak_rss_mb": round(peak, 1),
+        "server_requests": requests,
+        "expected_found": sum(stats["expected_found"] for stats in per_kind.values()),
+        "expected": expected,
+        "site_errors": summary["site_errors"],
+        "kinds": per_kind,
+        "strategies": strategies,
+    }
+
+
+def change(new, old):
+    """'+12.3%' relative to old, or '' without a baseline value."""
+    return f"{(new - old) / old * 100:+.1f}%" if old else ""
+
+
+def print_report(report, baseline=None):
+    base = baseline or {}
+    config = report["config"]
+    print(f"{config['sites']} sites, {config['workers']} workers, lean={config['lean']}, "
+          f"http_first={config['http_first']}" + (" (changes vs baseline)" if base else ""))
+    print(f"  startup          {report['startup_seconds']:8.2f} s")
+    print(f"  elapsed          {report['elapsed_seconds']:8.2f} s")
+    print(f"  sites/min        {report['sites_per_min']:8.1f}    {change(report['sites_per_min'], base.get('sites_per_min'))}")
+    print(f"  peak RSS         {report['peak_rss_mb']:8.1f} MB {change(report['peak_rss_mb'], base.get('peak_rss_mb'))}"
+          + ("" if psutil else " (this process only, psutil not installed)"))
+    print(f"  expected found   {report['expected_found']}/{report['expected']}"
+          + (f"  (baseline {base['expected_found']}/{base['expected']})" if base else ""))
+    print("  per kind:         sites  found  expected  errors")
+    for kind, stats in report["kinds"].items():
+        print(f"    {kind:<14} {stats['sites']:6} {stats['found']:6} {stats['expected_found']:9} {stats['errors']:7}")
+    print("  per strategy:     attempts  hit rate      avg      p50      p95      max")
+    base_strategies = base.get("strategies", {})
+    for name, stats in report["strategies"].items():
+        if not stats["attempts"]:
+            continue
+        old = base_strategies.get(name, {}).get("p50_seconds")
+        print(f"    {name:<16} {stats['attempts']:8} {stats['hit_rate']:9.1%} {stats['avg_seconds']:8.3f}"
+              f" {stats['p50_seconds']:8.3f} {stats['p95_seconds']:8.3f} {stats['max_seconds']:8.3f}"
+              f"  {change(stats['p50_seconds'], old)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sites", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--kinds", help=f"Comma-separated subset of: {','.join(KINDS)}")
+    parser.add_argument("--lean", action="store_true", help="Use the lean crawl profile")
+    parser.add_argument("--no-http-first", action="store_true", help="Always load pages in the browser")
+    parser.add_argument("--slow", type=float, default=SLOW_SECONDS, help="Delay of the 'slow' homepages (s)")
+    parser.add_argument("--report", help="Write the report to this JSON file")
+    parser.add_argument("--baseline", help="Earlier --report file to compare against")
+    args = parser.parse_args()
+    unknown = set((args.kinds or "").split(",")) - set(KINDS) - {""}
+    if unknown:
+        parser.error(f"unknown kinds: {', '.join(sorted(unknown))}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    report = run(args)
+    print_report(report, baseline)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
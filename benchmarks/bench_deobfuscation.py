@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Checks the obfuscated-address fixture corpus and times the decoding stage.
+
+Usage:
+    python benchmarks/bench_deobfuscation.py [--repeat N]
+
+Each file in benchmarks/fixtures/obfuscated/ is run through extract_emails_from_source
+(str and bytes input) and compared with expected.json; the exit status is 1 on any
+mismatch. The decoding stage is then timed on the fixtures scaled up to a large page.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emailcrawlerGUI import EmailExtractor, deobfuscate, extract_emails_from_source  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures", "obfuscated")
+
+
+def check_corpus():
+    with open(os.path.join(FIXTURES, "expected.json"), encoding="utf-8") as f:
+        expected = json.load(f)
+    plain = EmailExtractor(decode=False)
+    ok = True
+    for name, emails in sorted(expected.items()):
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            html = f.read()
+        found = sorted(extract_emails_from_source(html))
+        found_bytes = sorted(extract_emails_from_source(memoryview(html.encode("utf-8"))))
+        without = len(plain.extract(html))
+        status = "ok" if found == sorted(emails) == found_bytes else "FAIL"
+        ok = ok and status == "ok"
+        print(f"  {status:<4} {name:<24} {len(found)} found ({without} without decoding)")
+        if status != "ok":
+            print(f"       expected {sorted(emails)}\n       got      {found} / bytes {found_bytes}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("Fixture corpus:")
+    ok = check_corpus()
+
+    corpus = ""
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.endswith(".html"):
+            with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+                corpus += f.read()
+    page = ("<div>" + "lorem ipsum dolor sit amet " * 40 + "</div>") * 2000 + corpus
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        deobfuscate(page)
+        best = min(best, time.perf_counter() - start)
+    print(f"deobfuscate on {len(page) / 1024:.0f} KB: {best * 1000:.2f} ms")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
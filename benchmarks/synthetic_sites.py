@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Local synthetic-site server for the offline crawl benchmark (bench_crawl.py).
+
+Every site is a hostname s<N>-<kind>.test, so the server keeps no state: the kind
+in the name decides what each URL returns. The server is also a plain HTTP proxy.
+The crawler is pointed at it with proxy=..., HttpFetcher and Chrome alike, so the
+.test names need no DNS. facebook.test and google.test stand in for strategies 6
+and 7 (see FACEBOOK_URL / GOOGLE_SEARCH_URL in emailcrawlerGUI).
+
+Kinds:
+    home        email in the homepage text
+    contact     email only on /contact, linked from the homepage on even sites
+    mailto      email only in a mailto: link
+    obfuscated  Cloudflare, entity, [at]/[dot] or (at)/(dot) form, by site number
+    slow        homepage answers after a delay
+    missing     every page is a 404; the Facebook stand-in has the email
+    js          homepage is an empty shell that renders the email with JavaScript
+    google      no email on the site; the Google stand-in results have it
+    none        no email anywhere
+
+Usage (standalone, to look at the sites):
+    python benchmarks/synthetic_sites.py --port 8899
+    curl -x http://127.0.0.1:8899 http://s1-contact.test/contact
+"""
+import argparse
+import asyncio
+import random
+import re
+import threading
+
+from aiohttp import web
+
+KINDS = ["home", "contact", "mailto", "obfuscated", "slow", "missing", "js", "google", "none"]
+# Kinds whose address a complete strategy chain should find
+FINDABLE = [kind for kind in KINDS if kind != "none"]
+
+SLOW_SECONDS = 2.0
+
+_SITE_RE = re.compile(r"s(\d+)-([a-z]+)\.test")
+_WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+          "incididunt ut labore et dolore magna aliqua ut enim ad minim veniam quis").split()
+
+
+def site_host(n, kinds=KINDS):
+    return f"s{n}-{kinds[n % len(kinds)]}.test"
+
+
+def site_kind(host):
+    """(number, kind) for a synthetic site hostname, or None."""
+    m = _SITE_RE.fullmatch(host.lower())
+    return (int(m.group(1)), m.group(2)) if m else None
+
+
+def expected_email(host):
+    """The address hidden in a synthetic site, or None for the 'none' kind."""
+    site = site_kind(host)
+    return f"info@{host}" if site and site[1] in FINDABLE else None
+
+
+def filler(seed, paragraphs=4):
+    rnd = random.Random(seed)
+    return "".join("<p>" + " ".join(rnd.choice(_WORDS) for _ in range(40)) + "</p>" for _ in range(paragraphs))
+
+
+def page(title, body, seed=0):
+    return (f"<!DOCTYPE html><html><head><title>{title}</title></head><body>"
+            f"<nav><a href=\"/\">Home</a> <a href=\"/about\">About us</a></nav>"
+            f"<h1>{title}</h1>{body}{filler(seed)}</body></html>")
+
+
+def obfuscated(email, n):
+    user, domain = email.split("@")
+    form = n % 4
+    if form == 0:
+        key = n % 200 + 16
+        encoded = f"{key:02x}" + "".join(f"{ord(c) ^ key:02x}" for c in email)
+        return (f'<a href="/cdn-cgi/l/email-protection" class="__cf_email__" '
+                f'data-cfemail="{encoded}">[email&#160;protected]</a>')
+    if form == 1:
+        return "".join(f"&#{ord(c)};" for c in email)
+    if form == 2:
+        return f"{user} [at] {domain.replace('.', ' [dot] ')}"
+    return f"{user}(at){domain.replace('.', '(dot)')}"
+
+
+def homepage(host, n, kind):
+    email = f"info@{host}"
+    if kind in ("home", "slow"):
+        body = f"<p>Write to us at {email}</p>"
+    elif kind == "contact":
+        body = '<p><a href="/contact">Contact</a></p>' if n % 2 == 0 else "<p>Welcome.</p>"
+    elif kind == "mailto":
+        body = f'<p><a href="mailto:{email}">Send us a message</a></p>'
+    elif kind == "obfuscated":
+        body = f"<p>Email: {obfuscated(email, n)}</p>"
+    elif kind == "js":
+        # No address (nor enough text) in the source: only the browser can find it
+        return ("<!DOCTYPE html><html><head><title>App</title></head><body><div id=\"root\"></div>"
+                "<script>var u = \"info\", d = \"" + host + "\";"
+                "document.getElementById(\"root\").innerHTML = \"<p>Contact: \" + u + "
+                "String.fromCharCode(64) + d + \"</p>\";</script></body></html>")
+    else:
+        body = "<p>Welcome.</p>"
+    return page(host, body, n)
+
+
+class SyntheticSites:
+    """
+    Runs the server on an asyncio loop in a background thread (like HttpFetcher).
+    proxy is the URL to hand to crawl_stream(proxy=...).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, slow_seconds=SLOW_SECONDS):
+        self.slow_seconds = slow_seconds
+        self.requests = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.runner, port = asyncio.run_coroutine_threadsafe(self._start(host, port), self.loop).result()
+        self.proxy = f"http://{host}:{port}"
+
+    async def _start(self, host, port):
+        # Low-level server: no router, since proxied targets like "http://host" have no path
+        runner = web.ServerRunner(web.Server(self.handle, access_log=None))
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        return runner, site._server.sockets[0].getsockname()[1]
+
+    async def handle(self, request):
+        self.requests += 1
+        if request.method == "CONNECT":
+            # No TLS here: refuse HTTPS tunnels so the browser stays on http://
+            return web.Response(status=405)
+        host = request.host.split(":")[0].lower()
+        path = request.path.rstrip("/") or "/"
+        if host == "facebook.test":
+            return self.facebook(path.strip("/"))
+        if host == "google.test":
+            return self.google(request.query.get("q", ""))
+        site = site_kind(host)
+        if site is None:
+            return web.Response(status=404, text="Not found")
+        n, kind = site
+        if kind == "missing":
+            return web.Response(status=404, text=page("Not found", "<p>Nothing here.</p>", n),
+                                content_type="text/html")
+        if path == "/":
+            if kind == "slow":
+                await asyncio.sleep(self.slow_seconds)
+            return web.Response(text=homepage(host, n, kind), content_type="text/html")
+        if path == "/contact" and kind == "contact":
+            return web.Response(text=page("Contact", f"<p>Email: info@{host}</p>", n), content_type="text/html")
+        return web.Response(status=404, text=page("Not found", "<p>Nothing here.</p>", n), content_type="text/html")
+
+    @staticmethod
+    def facebook(name):
+        # Strategy 6 asks for the first label of the domain: s<N>-missing
+        if re.fullmatch(r"s\d+-missing", name):
+            body = f"<p>Contact info: info@{name}.test</p>"
+            return web.Response(text=page(name, body), content_type="text/html")
+        return web.Response(status=404, text=page("Page not found", "<p>This page isn't available.</p>"),
+                            content_type="text/html")
+
+    @staticmethod
+    def google(query):
+        m = _SITE_RE.search(query)
+        host = m.group(0) if m else ""
+        results = f"<p>{host} - Contact us: info@{host}</p>" if m and m.group(2) == "google" else ""
+        return web.Response(text=page("Search results", f"<div id=\"search\">{results}</div>"),
+                            content_type="text/html")
+
+    def close(self):
+        try:
+            asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--slow", type=float, default=SLOW_SECONDS, help="Delay of the 'slow' homepages (s)")
+    args = parser.parse_args()
+    sites = SyntheticSites(port=args.port, slow_seconds=args.slow)
+    print(f"Serving synthetic sites; use {sites.proxy} as HTTP proxy (Ctrl+C to stop)")
+    try:
+        sites.thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sites.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Command-line (GUI-free) batch runner for the email crawler.
+
+Reads websites lazily from a file or stdin (one per line) and writes each result
+as JSONL or CSV as soon as its site finishes, so memory stays flat however long
+the list is. Results are written in completion order; "index" is the position of
+the website in the input.
+
+With --queue, several processes (and hosts sharing the file) split one list
+through a SQLite job queue: each claims sites, crawls them and writes the results
+back, and a coordinator streams the combined output with --collect. "index" is
+then the position of the website in the queue.
+
+Examples:
+    python emailcrawlerCLI.py websites.txt -o results.jsonl -w 4
+    cat websites.txt | python emailcrawlerCLI.py - --format csv > results.csv
+
+    python emailcrawlerCLI.py websites.txt --queue /shared/jobs.sqlite3 --add-only
+    python emailcrawlerCLI.py --queue /shared/jobs.sqlite3 -w 4 -o /dev/null   # on each host
+    python emailcrawlerCLI.py --queue /shared/jobs.sqlite3 --collect -o results.jsonl
+"""
+import argparse
+import csv
+import json
+import sys
+import threading
+
+from emailcrawlerGUI import (
+    DEFAULT_CACHE_PATH,
+    DEFAULT_CONTACT_SUFFIXES,
+    DEFAULT_EXCLUDED_EMAILS,
+    DEFAULT_PLANNER_PATH,
+    DEAD_DOMAIN,
+    CrawlMetrics,
+    JobQueue,
+    LivenessChecker,
+    ResultCache,
+    StrategyPlanner,
+    crawl_queue,
+    crawl_stream,
+)
+
+
+def read_websites(stream):
+    """Yield non-empty, stripped lines from stream without reading it all."""
+    for line in stream:
+        website = line.strip()
+        if website:
+            yield website
+
+
+class ResultWriter:
+    """Thread-safe JSONL/CSV writer that flushes after every site."""
+
+    CSV_FIELDS = ["index", "website", "status", "email", "source"]
+
+    def __init__(self, out, fmt):
+        self.out = out
+        self.fmt = fmt
+        self.lock = threading.Lock()
+        if fmt == "csv":
+            self.csv = csv.writer(out)
+            self.csv.writerow(self.CSV_FIELDS)
+            out.flush()
+
+    def write(self, idx, website, result, error):
+        if error == DEAD_DOMAIN:
+            status, emails = "dead", []
+        elif error:
+            status, emails = "error", []
+        elif not result:
+            status, emails = "no_emails", []
+        else:
+            status = "ok"
+            # show_all gives a list of (email, src); otherwise a single tuple
+            emails = result if isinstance(result, list) else [result]
+        with self.lock:
+            if self.fmt == "csv":
+                for email, src in emails or [("", "")]:
+                    self.csv.writerow([idx, website, status, email, src])
+            else:
+                record = {
+                    "index": idx,
+                    "website": website,
+                    "status": status,
+                    "emails": [{"email": email, "source": src} for email, src in emails],
+                }
+                self.out.write(json.dumps(record) + "\n")
+            self.out.flush()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Crawl websites for email addresses without the GUI.")
+    parser.add_argument("input", nargs="?",
+                        help="File with one website per line ('-' for stdin, the default without --queue)")
+    parser.add_argument("-o", "--output", default="-", help="Output file ('-' for stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"],
+                        help="Output format (default: from the output extension, else jsonl)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Number of browsers crawling in parallel")
+    parser.add_argument("--show-all", action="store_true", help="Output every address found, not just the best one")
+    parser.add_argument("--no-headless", action="store_true", help="Show the browser windows")
+    parser.add_argument("--lean", action="store_true", help="Use the lean crawl profile")
+    parser.add_argument("--no-http-first", action="store_true", help="Always load pages in the browser")
+    parser.add_argument("--suffixes", default=DEFAULT_CONTACT_SUFFIXES, help="Contact URL suffixes (comma-separated)")
+    parser.add_argument("--exclude", default=DEFAULT_EXCLUDED_EMAILS, help="Excluded email patterns (comma-separated)")
+    parser.add_argument("--no-dns-check", action="store_true",
+                        help="Crawl every site, even when its domain has no A/AAAA/MX records")
+    parser.add_argument("--cache-ttl", type=float, default=0, help="Result cache TTL in days (0 = off)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="Result cache file")
+    parser.add_argument("--pin-order", action="store_true",
+                        help="Run strategies and contact suffixes in their configured order (no adaptive reordering)")
+    parser.add_argument("--planner-stats", default=DEFAULT_PLANNER_PATH,
+                        help="File with the strategy hit-rate/cost statistics, updated after the run")
+    parser.add_argument("--proxy", metavar="URL", help="Send HTTP and browser traffic through this proxy (http://host:port)")
+    parser.add_argument("--metrics", metavar="PREFIX",
+                        help="Write per-strategy metrics to PREFIX.json and PREFIX.prom at the end of the run")
+    parser.add_argument("--queue", metavar="PATH",
+                        help="Crawl sites claimed from this shared SQLite job queue; the input, if given, is added first")
+    parser.add_argument("--add-only", action="store_true", help="With --queue: only add the input to the queue")
+    parser.add_argument("--collect", action="store_true",
+                        help="With --queue: don't crawl, write every result of the queue as it finishes")
+    parser.add_argument("--worker-id", help="With --queue: name of this worker in the queue (default host:pid)")
+    args = parser.parse_args(argv)
+    if not args.queue and (args.add_only or args.collect or args.worker_id):
+        parser.error("--add-only, --collect and --worker-id need --queue")
+    if args.input is None and not args.queue:
+        args.input = "-"
+    return args
+
+
+def crawl(args, src, jobs, writer):
+    """Crawl the input, or the sites claimed from jobs, writing each result as it finishes."""
+    contact_suffixes = [s.strip() for s in args.suffixes.split(",") if s.strip()]
+    excluded_emails = [s.strip().lower() for s in args.exclude.split(",") if s.strip()]
+    cache = ResultCache(args.cache, args.cache_ttl) if args.cache_ttl > 0 else None
+    # Per-site records would grow with the input, so the CLI keeps only the aggregates
+    metrics = CrawlMetrics(keep_sites=False) if args.metrics else None
+    planner = StrategyPlanner(pinned=args.pin_order)
+    planner.load(args.planner_stats)
+    options = dict(
+        headless=not args.no_headless,
+        show_all=args.show_all,
+        contact_suffixes=contact_suffixes,
+        exclude_list=excluded_emails,
+        http_first=not args.no_http_first,
+        lean=args.lean,
+        cache=cache,
+        metrics=metrics,
+        planner=planner,
+        liveness=None if args.no_dns_check else LivenessChecker(),
+        proxy=args.proxy
+    )
+    try:
+        if jobs is not None:
+            # Queue job ids start at 1; "index" stays 0-based like for a plain input
+            crawl_queue(jobs, args.worker_id, args.workers,
+                        on_result=lambda job_id, *rest: writer.write(job_id - 1, *rest), **options)
+        else:
+            crawl_stream(read_websites(src), args.workers, on_result=writer.write, **options)
+    finally:
+        planner.save(args.planner_stats)
+        if metrics is not None:
+            metrics.export(args.metrics)
+        if cache is not None:
+            cache.close()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+
+    src = None if args.input is None else sys.stdin if args.input == "-" else open(args.input, encoding="utf-8-sig")
+    jobs = JobQueue(args.queue) if args.queue else None
+    out = None
+    try:
+        if jobs is not None and src is not None:
+            added = jobs.add(read_websites(src))
+            print(f"Queued {added} websites in {args.queue}", file=sys.stderr)
+        if args.add_only:
+            return
+        out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+        writer = ResultWriter(out, fmt)
+        if args.collect:
+            for job_id, website, result, error in jobs.stream():
+                writer.write(job_id - 1, website, result, error)
+        else:
+            crawl(args, src, jobs, writer)
+    finally:
+        if jobs is not None:
+            jobs.close()
+        if src is not None and src is not sys.stdin:
+            src.close()
+        if out is not None and out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
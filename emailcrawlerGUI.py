@@ -1,12 +1,40 @@
 import undetected_chromedriver as uc
+import asyncio
+import aiohttp
 import time
 import re
 import os
 import threading
+import queue
+import concurrent.futures
+import socket
+from contextlib import contextmanager
+import json
+import shutil
+import sqlite3
+import tempfile
+import traceback
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, partial
+from html.parser import HTMLParser
+from html import unescape
+from urllib.parse import unquote, urljoin, urlsplit
 from difflib import SequenceMatcher
 import tkinter as tk
-from tkinter import messagebox, scrolledtext, ttk
-from selenium.webdriver.common.by import By
+from tkinter import filedialog, messagebox, scrolledtext, ttk
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.resolver
+except ImportError:  # dnspython is optional: without it only A/AAAA are checked, via getaddrinfo
+    dns = None
+
+try:
+    import psutil
+except ImportError:  # psutil is optional: without it browsers are only recycled by site count
+    psutil = None
 
 # ================================
 # Global default advanced options
@@ -14,54 +42,692 @@ from selenium.webdriver.common.by import By
 DEFAULT_CONTACT_SUFFIXES = "/contact,/contact-us,/contactus,/contact-info,/careers,/send-us-a-message,/get-in-touch"
 DEFAULT_EXCLUDED_EMAILS = "@sentry-next.wixpress.com,@sentry.io,@sentry.wixpress.com,@example.com"
 
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+              "AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/115.0.0.0 Safari/537.36")
+
+EMAIL_PATTERN = r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"
+
+# Strategy 6 and 7 endpoints ({name}: first label of the domain; {query}: the search
+# terms). The offline benchmark points them at local stand-ins.
+FACEBOOK_URL = "https://www.facebook.com/{name}"
+GOOGLE_SEARCH_URL = "https://www.google.com/search?q={query}"
+
+# Adaptive page wait: poll interval and how long the DOM must stay quiet to count as settled
+WAIT_POLL_INTERVAL = 0.1
+WAIT_SETTLE_TIME = 0.5
+
+# "Lean crawl" profile: resources we never need to read emails, blocked through CDP.
+# File types are anchored to the end of the path (with or without a query) and trackers
+# to the host, since "*.gif*" or "*hotjar.com*" also block documents like
+# https://www.gifts.com/. Chrome still looks for the parts between the '*' anywhere in
+# the URL, so load_in_browser also lifts the patterns the page's own URL would match.
+LEAN_BLOCKED_EXTENSIONS = [
+    "png", "jpg", "jpeg", "gif", "webp", "svg", "ico",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm", "mp3", "avi",
+    "css",
+]
+LEAN_BLOCKED_HOSTS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "connect.facebook.net", "hotjar.com",
+    "clarity.ms", "hubspot.com", "adservice.google.*", "scorecardresearch.com",
+]
+LEAN_BLOCKED_URLS = (
+    [f"*.{ext}{tail}" for ext in LEAN_BLOCKED_EXTENSIONS for tail in ("", "?*")]
+    + [f"*://{sub}{host}/*" for host in LEAN_BLOCKED_HOSTS for sub in ("", "*.")]
+)
+
+# HTTP statuses that usually mean a bot wall rather than a missing page
+ESCALATE_STATUSES = {401, 403, 429, 503}
+
+
+# Obfuscated address forms, decoded in one pass in front of the email regex:
+#   Cloudflare email protection (data-cfemail / email-protection#hex), numeric and
+#   @/. HTML entities, URL-encoded mailto: targets, and "[at]"/"(dot)" spellings. Bare
+#   "at ... dot" is left alone: in prose ("works at Acme dot com") it is rarely an address.
+def decode_cfemail(hex_string):
+    """Decode a Cloudflare-protected address: the first byte is the XOR key for the rest."""
+    try:
+        data = bytes.fromhex(hex_string)
+    except ValueError:
+        return ""
+    if not data:
+        return ""
+    return bytes(b ^ data[0] for b in data[1:]).decode("utf-8", errors="replace")
+
+
+# Obfuscation forms, one pass each: (cheap gate, full pattern, replacement).
+# A single alternation of all of them loses the literal-prefix fast scan of every
+# branch and is ~10x slower on clean pages, so each form gets its own pass and the
+# expensive patterns only run when their gate finds something.
+_OBFUSCATION_PASSES = [
+    # Cloudflare email protection, in the attribute and in the link
+    (None, r'data-cfemail="([0-9a-fA-F]+)"',
+     lambda m: f'data-cfemail="{decode_cfemail(m.group(1))}"'),
+    (None, r"/cdn-cgi/l/email-protection#([0-9a-fA-F]+)",
+     lambda m: "/cdn-cgi/l/email-protection#" + decode_cfemail(m.group(1))),
+    # &#64; &#x40; &commat; &period; ...
+    (None, r"&#[xX]?[0-9a-fA-F]{1,6};|&(?:commat|period);", lambda m: unescape(m.group())),
+    # mailto:info%40acme.com
+    (None, r"""mailto:([^"'\s<>]*%[0-9a-fA-F]{2}[^"'\s<>]*)""", lambda m: "mailto:" + unquote(m.group(1))),
+    # info [at] acme (dot) com, info {arroba} acme [punto] es
+    (r"[\[\(\{][ \t]*(?:at|arroba|dot|punto|punkt)[ \t]*[\]\)\}]",
+     r"[ \t]?[\[\(\{][ \t]*(?:(at|arroba)|dot|punto|punkt)[ \t]*[\]\)\}][ \t]?",
+     lambda m: "@" if m.group(1) else "."),
+]
+_OBFUSCATION_PASSES = [
+    (re.compile(gate, re.I) if gate else None, re.compile(pattern, re.I), repl,
+     re.compile((gate or pattern).encode("ascii"), re.I))
+    for gate, pattern, repl in _OBFUSCATION_PASSES
+]
+
+
+def looks_obfuscated(source):
+    """Cheap check for any obfuscation form in source (str or bytes-like)."""
+    is_str = isinstance(source, str)
+    return any(((gate or pattern) if is_str else gate_bytes).search(source)
+               for gate, pattern, _, gate_bytes in _OBFUSCATION_PASSES)
+
+
+def deobfuscate(source):
+    """Rewrite obfuscated addresses in source (str) into plain user@domain.tld text."""
+    for gate, pattern, repl, _ in _OBFUSCATION_PASSES:
+        if gate is None or gate.search(source):
+            source = pattern.sub(repl, source)
+    return source
+
+
+# Characters allowed in the local part; also used to tell where an address can start
+_LOCAL_CHARS = r"A-Za-z0-9._%+-"
+
+
+class EmailExtractor:
+    """
+    Email matcher with the pattern and the exclude filters compiled once.
+    extract() gives the same set as the plain re.findall + filter passes, but scans
+    in linear time (findall alone is quadratic on long runs of local-part characters,
+    e.g. base64 blobs) and also accepts bytes, bytearray or memoryview input.
+    With decode=True, obfuscated addresses are decoded first (see deobfuscate).
+    """
+
+    def __init__(self, exclude_list=None, decode=True):
+        self.decode = decode
+        if exclude_list is None:
+            exclude_list = [x.strip().lower() for x in DEFAULT_EXCLUDED_EMAILS.split(",")]
+        # One matcher for both the .jpg/.png suffix filter and every excluded pattern
+        reject = [re.escape(excl.lower()) for excl in exclude_list] + [r"\.(?:jpg|png)$"]
+        self.reject = re.compile("|".join(reject), re.I)
+        # (address starting a run of local chars, address anywhere, single local char)
+        local = "[" + _LOCAL_CHARS + "]"
+        patterns = ("(?<!%s)%s" % (local, EMAIL_PATTERN), EMAIL_PATTERN, local)
+        self._str = [re.compile(p) for p in patterns]
+        self._bytes = [re.compile(p.encode("ascii")) for p in patterns]
+
+    def find_all(self, source):
+        """All raw matches in source, in order, exactly like re.findall(EMAIL_PATTERN, source)."""
+        run_start, anywhere, local = self._str if isinstance(source, str) else self._bytes
+        found = []
+        pos = 0
+        while True:
+            m = run_start.search(source, pos)
+            if m is None:
+                return found
+            found.append(m.group())
+            end = m.end()
+            # An address glued to the previous one starts right where that one ended
+            while local.match(source, end):
+                m = anywhere.match(source, end)
+                if m is None:
+                    break
+                found.append(m.group())
+                end = m.end()
+            pos = end
+
+    def extract(self, source):
+        """Set of non-excluded emails in source (str, bytes, bytearray or memoryview)."""
+        if self.decode:
+            if not isinstance(source, str) and looks_obfuscated(source):
+                # Rare: only pages with obfuscated addresses leave the bytes fast path
+                source = bytes(source).decode("utf-8", errors="replace")
+            if isinstance(source, str):
+                source = deobfuscate(source)
+        emails = set(self.find_all(source))
+        if not isinstance(source, str):
+            emails = {email.decode("ascii") for email in emails}
+        reject = self.reject.search
+        return {email for email in emails if not reject(email)}
+
+
+@lru_cache(maxsize=32)
+def _cached_extractor(exclude_key):
+    return EmailExtractor(None if exclude_key is None else list(exclude_key))
+
+
+def get_extractor(exclude_list=None):
+    """Shared EmailExtractor for exclude_list, compiled once per distinct list."""
+    return _cached_extractor(None if exclude_list is None else tuple(exclude_list))
+
 
 def extract_emails_from_source(source, exclude_list=None):
     """Extract emails using regex and filter out those ending in .jpg, .png or matching any pattern in exclude_list."""
+    return get_extractor(exclude_list).extract(source)
+
+
+class HttpFetcher:
+    """
+    Plain HTTP fetch tier. Runs an asyncio loop in a background thread with a single
+    pooled aiohttp session, so it can be shared by every crawler worker.
+    """
+
+    def __init__(self, timeout=10, limit=64, limit_per_host=8, max_bytes=5 * 1024 * 1024, proxy=None):
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.proxy = proxy
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.session = self.run(self._open_session(limit, limit_per_host))
+
+    async def _open_session(self, limit, limit_per_host):
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=300)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+        )
+
+    def run(self, coro):
+        """Run a coroutine on the fetcher loop from any thread and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def fetch_async(self, url):
+        """Return (status, html, final_url) for url, or None if the request failed."""
+        try:
+            async with self.session.get(url, allow_redirects=True, proxy=self.proxy) as resp:
+                body = await resp.content.read(self.max_bytes)
+                charset = resp.charset or "utf-8"
+                return resp.status, body.decode(charset, errors="replace"), str(resp.url)
+        except Exception:
+            return None
+
+    def fetch(self, url):
+        return self.run(self.fetch_async(url))
+
+    def submit(self, url):
+        """Start fetching url without waiting; returns a concurrent.futures.Future (cancel() aborts it)."""
+        return asyncio.run_coroutine_threadsafe(self.fetch_async(url), self.loop)
+
+    def close(self):
+        try:
+            self.run(self.session.close())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+
+
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style|noscript)\b.*?</\1>", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_JS_HINTS = ("enable javascript", "requires javascript", "you need to enable javascript",
+             'id="root"></div>', 'id="app"></div>', 'id="__next"></div>')
+
+
+def looks_js_rendered(html):
+    """Heuristic: True if the HTML is an empty shell whose content is built by scripts."""
+    lowered = html.lower()
+    if any(hint in lowered for hint in _JS_HINTS):
+        return True
+    text = _TAG_RE.sub(" ", _SCRIPT_STYLE_RE.sub(" ", html))
+    return len(" ".join(text.split())) < 200
+
+
+def http_probe(fetcher, url, exclude_list=None, probe=None):
+    """
+    Try url over plain HTTP. Returns (emails, html, final_url), or None when the
+    page must be loaded in the browser instead (fetch failed, bot wall or JS-rendered).
+    """
+    return classify_page(fetcher.fetch(url), url, exclude_list, probe)
+
+
+def classify_page(page, url, exclude_list=None, probe=None):
+    """Turn a HttpFetcher (status, html, final_url) result into what http_probe returns."""
+    if page is None:
+        note_error(probe, f"HTTP fetch failed: {url}")
+        return None
+    status, html, final_url = page
+    if probe is not None:
+        probe["bytes"] += len(html)
+    if status in ESCALATE_STATUSES or status >= 500:
+        return None
+    if status >= 400:
+        return set(), "", final_url
+    emails = extract_emails_from_source(html, exclude_list)
+    if emails or not looks_js_rendered(html):
+        return emails, html, final_url
+    return None
+
+
+def probe_urls_concurrently(fetcher, urls, exclude_list=None, probe=None, on_done=None):
+    """
+    Fetch all urls over HTTP at the same time. The first page that yields emails wins
+    and the requests still in flight are cancelled. on_done(url, seconds, hit) is
+    called for every page that completed.
+    Returns (emails, escalate): escalate lists, in input order, the URLs that need the
+    browser (only meaningful when no page yielded emails).
+    """
+    start = time.perf_counter()
+    futures = {fetcher.submit(url): url for url in urls}
+    escalate = set()
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            url = futures[future]
+            page = classify_page(future.result(), url, exclude_list, probe)
+            if on_done:
+                on_done(url, time.perf_counter() - start, bool(page and page[0]))
+            if page is None:
+                escalate.add(url)
+            elif page[0]:
+                return page[0], []
+    finally:
+        for future in futures:
+            future.cancel()
+    return set(), [url for url in urls if url in escalate]
+
+
+def fetch_emails_http(fetcher, url, exclude_list=None, probe=None):
+    """Like http_probe, but returns only the emails (or None to escalate)."""
+    page = http_probe(fetcher, url, exclude_list, probe)
+    return None if page is None else page[0]
+
+
+# Installs a MutationObserver on first call and reports
+# [readyState, ms since last DOM mutation, email matches]
+_PAGE_STATE_JS = """
+var w = window;
+if (!w.__ecObs) {
+    w.__ecLast = performance.now();
+    w.__ecObs = new MutationObserver(function () { w.__ecLast = performance.now(); });
+    w.__ecObs.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+var html = document.documentElement ? document.documentElement.innerHTML : "";
+return [document.readyState, performance.now() - w.__ecLast, html.match(/%s/g) || []];
+""" % EMAIL_PATTERN
+
+
+def wait_for_page(driver, timeout=5, exclude_list=None):
+    """
+    Wait until the page is usable instead of sleeping a fixed time. Returns as soon as
+    an email shows up in the live DOM, or when the document is complete and the DOM
+    has been quiet for WAIT_SETTLE_TIME, or after timeout seconds at the latest.
+    """
+    deadline = time.monotonic() + timeout
+    # Eager (lean) drivers don't wait for subresources, so an interactive document is enough
+    try:
+        eager = driver.capabilities.get("pageLoadStrategy") == "eager"
+    except Exception:
+        eager = False
+    ready_states = ("interactive", "complete") if eager else ("complete",)
+    while time.monotonic() < deadline:
+        try:
+            ready, quiet_ms, matches = driver.execute_script(_PAGE_STATE_JS)
+        except Exception:
+            # Mid-navigation, the script can fail; just poll again
+            time.sleep(WAIT_POLL_INTERVAL)
+            continue
+        if matches and extract_emails_from_source(" ".join(matches), exclude_list):
+            return
+        if ready in ready_states and quiet_ms >= WAIT_SETTLE_TIME * 1000:
+            return
+        time.sleep(WAIT_POLL_INTERVAL)
+
+
+# Runs the email pattern and the exclude filter inside the page and returns only
+# [email, context] pairs, context being "mailto", "href", another attribute name or "text".
+# Values that look obfuscated come back as [raw value, "raw:" + context] for deobfuscate().
+_EXTRACT_EMAILS_JS = """
+var re = /%s/g, excl = arguments[0], found = {}, out = [];
+var obf = /data-cfemail|email-protection#|%%40|[\\[({]\\s*(at|arroba)\\s*[\\])}]/i;
+function raw(value, ctx) {
+    if (obf.test(value)) out.push([value.slice(0, 2000), "raw:" + ctx]);
+}
+function add(value, ctx) {
+    var m = value.match(re);
+    if (!m) return;
+    for (var i = 0; i < m.length; i++) {
+        var email = m[i], low = email.toLowerCase();
+        if (found[email] || /\\.(jpg|png)$/.test(low)) continue;
+        var excluded = false;
+        for (var j = 0; j < excl.length; j++) {
+            if (low.indexOf(excl[j]) !== -1) { excluded = true; break; }
+        }
+        if (excluded) continue;
+        found[email] = true;
+        out.push([email, ctx]);
+    }
+}
+var els = document.getElementsByTagName("*");
+for (var i = 0; i < els.length; i++) {
+    var attrs = els[i].attributes;
+    for (var j = 0; j < attrs.length; j++) {
+        var v = attrs[j].value, ctx = attrs[j].name;
+        if (ctx === "href") ctx = /^mailto:/i.test(v) ? "mailto" : "href";
+        if (ctx === "data-cfemail") {
+            out.push(['data-cfemail="' + v + '"', "raw:" + ctx]);
+            continue;
+        }
+        if (v.indexOf("@") !== -1) add(v, ctx);
+        else raw(v, ctx);
+    }
+}
+if (document.documentElement) {
+    var walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_TEXT | NodeFilter.SHOW_COMMENT);
+    while (walker.nextNode()) {
+        var t = walker.currentNode.nodeValue;
+        if (!t) continue;
+        if (t.indexOf("@") !== -1) add(t, "text");
+        else raw(t, "text");
+    }
+}
+return out;
+""" % EMAIL_PATTERN
+
+# Set to False to always ship the full page_source to Python and run the regex there
+IN_PAGE_EXTRACTION = True
+
+
+def extract_emails_in_page(driver, exclude_list=None):
+    """
+    Extract emails inside the browser, so only the matches cross the WebDriver channel.
+    Returns a list of (email, context) pairs.
+    """
+    extractor = get_extractor(exclude_list)
     if exclude_list is None:
         exclude_list = [x.strip().lower() for x in DEFAULT_EXCLUDED_EMAILS.split(",")]
-    emails = re.findall(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", source)
-    # Filtrar direcciones que terminen en .jpg o .png
-    emails = {email for email in emails if not email.lower().endswith((".jpg", ".png"))}
-    # Filtrar direcciones que contengan alguno de los patrones excluidos
-    emails = {email for email in emails if not any(excl in email.lower() for excl in exclude_list)}
-    return emails
+    found = []
+    for value, ctx in driver.execute_script(_EXTRACT_EMAILS_JS, list(exclude_list)):
+        if ctx.startswith("raw:"):
+            found.extend((email, ctx[4:]) for email in extractor.extract(value))
+        else:
+            found.append((value, ctx))
+    return found
 
 
-def try_url(driver, url, wait_time=5, exclude_list=None):
-    """Attempt to load a URL, wait, and extract emails from the page source."""
+def extract_emails_from_driver(driver, exclude_list=None):
+    """Emails on the page currently loaded in driver, using in-page extraction when available."""
+    if IN_PAGE_EXTRACTION:
+        try:
+            return {email for email, _ in extract_emails_in_page(driver, exclude_list)}
+        except Exception:
+            pass
+    return extract_emails_from_source(driver.page_source, exclude_list)
+
+
+def browser_page_bytes(driver):
+    """Size of the document the browser loaded, from the Navigation Timing entry."""
     try:
-        driver.get(url)
-        time.sleep(wait_time)
-        return extract_emails_from_source(driver.page_source, exclude_list)
+        return int(driver.execute_script(
+            "var e = performance.getEntriesByType('navigation')[0]; return e ? e.decodedBodySize : 0;"
+        ) or 0)
     except Exception:
-        return set()
+        return 0
 
 
-def click_contact_link(driver, wait_time=5, exclude_list=None):
-    """Look for links containing the text 'contact', click on the first one, and extract emails."""
+def blocked_url_matches(url, pattern):
+    """Chrome's test for a blocked-URL pattern: the parts between '*' occur in url in order."""
+    pos = 0
+    for part in pattern.split("*"):
+        pos = url.find(part, pos)
+        if pos < 0:
+            return False
+        pos += len(part)
+    return True
+
+
+def lean_blocked_urls(url):
+    """LEAN_BLOCKED_URLS minus the patterns that would block the document at url (or its www. form)."""
+    pages = (url, f"https://www.{get_domain(url)}/")
+    return [pattern for pattern in LEAN_BLOCKED_URLS
+            if not any(blocked_url_matches(page, pattern) for page in pages)]
+
+
+def load_in_browser(driver, url, wait_time=5, exclude_list=None, probe=None):
+    """Navigate the browser to url, wait for it and return the emails on the page."""
+    if getattr(driver, "lean_blocked", None) is not None:
+        blocked = lean_blocked_urls(url)
+        if blocked != driver.lean_blocked:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+            driver.lean_blocked = blocked
+    driver.get(url)
+    wait_for_page(driver, wait_time, exclude_list)
+    if probe is not None:
+        probe["bytes"] += browser_page_bytes(driver)
+    return extract_emails_from_driver(driver, exclude_list)
+
+
+def try_url(driver, url, wait_time=5, exclude_list=None, fetcher=None, probe=None):
+    """
+    Attempt to load a URL, wait, and extract emails from the page source.
+    With a fetcher the page is first tried over plain HTTP and the browser is only used as a fallback.
+    """
+    if fetcher is not None:
+        emails = fetch_emails_http(fetcher, url, exclude_list, probe)
+        if emails is not None:
+            return emails
     try:
-        links = driver.find_elements(
-            By.XPATH,
-            "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'contact')]"
-        )
-        for link in links:
-            href = link.get_attribute("href")
+        return load_in_browser(driver, url, wait_time, exclude_list, probe)
+    except Exception as e:
+        note_error(probe, e)
+        return set()
+
+
+# Collects every link of the rendered page in a single WebDriver round-trip
+_HARVEST_LINKS_JS = """
+return Array.prototype.map.call(document.querySelectorAll("a[href]"), function (a) {
+    return [a.href, (a.textContent || "").trim().slice(0, 200)];
+});
+"""
+
+
+class LinkParser(HTMLParser):
+    """Collects (absolute href, text) pairs for every <a href> in raw HTML."""
+
+    def __init__(self, base_url):
+        super().__init__()
+        self.base_url = base_url
+        self.links = []
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
             if href:
-                try:
-                    link.click()
-                    time.sleep(wait_time)
-                    return extract_emails_from_source(driver.page_source, exclude_list)
-                except Exception:
-                    continue
+                self._current = [urljoin(self.base_url, href.strip()), ""]
+                self.links.append(self._current)
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._current[1] += data
+
+    def handle_endtag(self, tag):
+        if tag == "a":
+            self._current = None
+
+
+def parse_links(html, base_url):
+    parser = LinkParser(base_url)
+    try:
+        parser.feed(html)
     except Exception:
         pass
-    return set()
+    return [(href, " ".join(text.split())) for href, text in parser.links]
+
+
+def harvest_links(driver):
+    try:
+        return [(href, text) for href, text in driver.execute_script(_HARVEST_LINKS_JS) if href]
+    except Exception:
+        return []
+
+
+def build_link_index(links, website):
+    """
+    Sort the links of a main page into the groups the later strategies need:
+      - contact_text: links whose text mentions 'contact'
+      - contact_href: same-domain links whose URL mentions 'contact'
+      - about: same-domain links whose text or URL mentions 'about'
+      - mailto: addresses from mailto: links
+      - pages: every same-domain (href, text) pair, for contact page discovery
+    """
+    domain = get_domain(website).lower()
+    index = {"contact_text": [], "contact_href": [], "about": [], "mailto": [], "pages": []}
+    for href, text in links:
+        href_lower = href.lower()
+        text_lower = text.lower()
+        if href_lower.startswith("mailto:"):
+            email = href.split(":", 1)[1].split("?")[0].strip()
+            if email and email not in index["mailto"]:
+                index["mailto"].append(email)
+            continue
+        if not href_lower.startswith(("http://", "https://")):
+            continue
+        same_domain = domain in get_domain(href_lower)
+        if same_domain and len(index["pages"]) < MAX_INDEXED_PAGES:
+            index["pages"].append((href, text))
+        groups = []
+        if "contact" in text_lower:
+            groups.append("contact_text")
+        if same_domain and "contact" in href_lower:
+            groups.append("contact_href")
+        if same_domain and ("about" in text_lower or "about" in href_lower):
+            groups.append("about")
+        for group in groups:
+            if href not in index[group]:
+                index[group].append(href)
+    return index
+
+
+# Keywords marking contact and about pages, in the languages we see most.
+# Weights: how strongly a match in the URL path suggests the page has an address.
+CONTACT_KEYWORDS = {
+    "contact": 10, "kontakt": 10, "contacto": 10, "contactenos": 10, "contactanos": 10,
+    "contatti": 10, "contato": 10, "contatto": 10, "contactez": 10, "nous-contacter": 10,
+    "impressum": 9, "imprint": 8, "aviso-legal": 7, "mentions-legales": 7,
+    "get-in-touch": 9, "reach-us": 8, "write-to-us": 8, "enquir": 6, "inquir": 6,
+    "yhteystiedot": 10, "kapcsolat": 10, "kontakty": 10, "iletisim": 10, "contacten": 10,
+    "support": 4, "help": 2,
+}
+ABOUT_KEYWORDS = {
+    "about": 5, "quienes-somos": 5, "nosotros": 5, "sobre": 4, "empresa": 3,
+    "ueber-uns": 5, "uber-uns": 5, "über-uns": 5, "unternehmen": 3,
+    "chi-siamo": 5, "a-propos": 5, "qui-sommes-nous": 5, "over-ons": 5, "om-oss": 5,
+    "team": 3, "company": 3, "equipo": 3,
+}
+_SKIP_EXTENSIONS = (".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".zip", ".doc", ".docx",
+                    ".xls", ".xlsx", ".mp4", ".mp3", ".css", ".js", ".xml", ".gz")
+_LOC_RE = re.compile(r"<loc>\s*([^<\s]+)\s*</loc>", re.I)
+
+# Discovery limits: links kept from the homepage, sitemaps read and sitemap URLs scored per site
+MAX_INDEXED_PAGES = 500
+MAX_SITEMAPS = 3
+MAX_SITEMAP_URLS = 5000
+
+
+def score_candidate(url, text=""):
+    """How likely url (with its link text) is a contact or about page; 0 means not a candidate."""
+    parts = urlsplit(url)
+    path = unquote(parts.path).lower()
+    if path.endswith(_SKIP_EXTENSIONS):
+        return 0
+    text = text.lower()
+    score = 0
+    for keywords, text_weight in ((CONTACT_KEYWORDS, 1.0), (ABOUT_KEYWORDS, 0.5)):
+        for keyword, weight in keywords.items():
+            if keyword in path:
+                score += weight
+            if keyword.replace("-", " ") in text:
+                score += weight * text_weight
+    if score == 0:
+        return 0
+    # Prefer short, clean URLs: /contact over /blog/2019/05/how-to-contact-support?page=2
+    score -= 1.5 * max(0, path.strip("/").count("/"))
+    if parts.query:
+        score -= 2
+    return max(score, 0)
+
+
+def sitemap_urls(fetcher, website):
+    """Page URLs listed in the site's sitemaps (from robots.txt, else /sitemap.xml)."""
+    parts = urlsplit(website if "//" in website else "http://" + website)
+    base = f"{parts.scheme}://{parts.netloc}"
+    sitemaps = []
+    robots = fetcher.fetch(base + "/robots.txt")
+    if robots is not None and robots[0] < 400:
+        for line in robots[1].splitlines():
+            if line.lower().startswith("sitemap:"):
+                sitemaps.append(line.split(":", 1)[1].strip())
+    if not sitemaps:
+        sitemaps = [base + "/sitemap.xml"]
+
+    urls = []
+    fetched = 0
+    while sitemaps and fetched < MAX_SITEMAPS and len(urls) < MAX_SITEMAP_URLS:
+        sitemap = sitemaps.pop(0)
+        if sitemap.endswith(".gz"):
+            continue
+        page = fetcher.fetch(sitemap)
+        fetched += 1
+        if page is None or page[0] >= 400:
+            continue
+        locs = [unescape(loc) for loc in _LOC_RE.findall(page[1])]
+        if "<sitemapindex" in page[1][:2000].lower():
+            # Child sitemaps: look at page sitemaps before post/product ones
+            sitemaps.extend(sorted(locs, key=lambda loc: "page" not in loc.lower()))
+        else:
+            urls.extend(locs)
+    return urls[:MAX_SITEMAP_URLS]
+
+
+def discover_pages(website, links, fetcher=None, limit=3):
+    """
+    Rank candidate contact/about URLs from the homepage links and, with a fetcher,
+    the sitemap, using CONTACT_KEYWORDS / ABOUT_KEYWORDS. Returns the top limit URLs.
+    """
+    domain = get_domain(website).lower()
+    scores = {}
+    for href, text in links["pages"]:
+        url = href.split("#")[0]
+        scores[url] = max(scores.get(url, 0), score_candidate(url, text))
+    if fetcher is not None:
+        for url in sitemap_urls(fetcher, website):
+            if domain in get_domain(url).lower():
+                scores[url] = max(scores.get(url, 0), score_candidate(url))
+    ranked = sorted((url for url, score in scores.items() if score > 0), key=lambda url: -scores[url])
+    return ranked[:limit]
+
+
+def load_main_page(driver, website, wait_time=5, exclude_list=None, fetcher=None, probe=None):
+    """
+    Load the main page once (over HTTP if possible, otherwise in the browser) and
+    return (emails, link_index) so later strategies don't have to query the DOM again.
+    """
+    if fetcher is not None:
+        page = http_probe(fetcher, website, exclude_list, probe)
+        if page is not None:
+            emails, html, final_url = page
+            return emails, build_link_index(parse_links(html, final_url), website)
+    try:
+        emails = load_in_browser(driver, website, wait_time, exclude_list, probe)
+        return emails, build_link_index(harvest_links(driver), website)
+    except Exception as e:
+        note_error(probe, e)
+        return set(), build_link_index([], website)
 
 
 def get_domain(website):
-    """Extract the domain from a given URL."""
+    """Extract the domain (lowercase host, without www. or port) from a given URL."""
     try:
-        domain = website.split("//")[-1].split("/")[0]
+        domain = website.strip().split("//")[-1].split("/")[0].split("?")[0].split("#")[0]
+        domain = domain.rsplit("@", 1)[-1].split(":")[0].rstrip(".").lower()
         if domain.startswith("www."):
             domain = domain[4:]
         return domain
@@ -69,108 +735,512 @@ def get_domain(website):
         return website
 
 
-def google_search_email(driver, website, wait_time=5, exclude_list=None):
+# Public suffixes with two labels that are common in our lists; a domain under one of
+# them is registered at the third label (acme.co.uk, not co.uk). Not the full PSL.
+MULTI_PART_SUFFIXES = {
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "ltd.uk", "plc.uk", "me.uk",
+    "com.au", "net.au", "org.au", "co.nz", "org.nz", "co.za", "co.in", "co.jp", "co.kr",
+    "com.br", "net.br", "org.br", "com.mx", "org.mx", "com.ar", "com.co", "com.pe", "com.ve",
+    "com.ec", "com.uy", "com.py", "com.bo", "com.gt", "com.do", "com.pa",
+    "com.es", "org.es", "nom.es", "gob.es", "edu.es", "com.pt", "com.tr", "com.cn", "com.hk",
+    "com.sg", "com.my", "com.tw",
+}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Hosts where the path names the business (facebook.com/acme, sites.google.com/view/acme):
+# their paths and queries are always kept
+PATH_BASED_HOSTS = {
+    "facebook.com", "m.facebook.com", "instagram.com", "linkedin.com", "twitter.com", "x.com",
+    "tiktok.com", "youtube.com", "pinterest.com", "linktr.ee", "sites.google.com", "github.com",
+    "gitlab.com", "medium.com", "yelp.com", "tripadvisor.com", "wa.me",
+}
+# Single-segment paths that are just a page of the site, so the site root is crawled instead
+PLAIN_PAGES = {
+    "index", "home", "about", "about-us", "aboutus", "contact", "contact-us", "contactus",
+    "contacto", "kontakt", "impressum", "team", "services", "en", "es", "de", "fr",
+}
+
+
+def canonical_url(website):
+    """
+    Canonical site URL for an input line: scheme (https if missing) and host in
+    lowercase, default port and trailing slash dropped. The crawler works per site,
+    so 'acme.com/about' and 'HTTP://Acme.com:80/' both become the site root; any
+    other path (and on PATH_BASED_HOSTS also the query) is kept, since it may be
+    the business itself, like 'sites.google.com/view/acme-dental'.
+    """
+    website = website.strip()
+    if "://" not in website:
+        website = "https://" + website.lstrip("/")
+    parts = urlsplit(website)
+    scheme = parts.scheme.lower() if parts.scheme.lower() in DEFAULT_PORTS else "https"
+    host = (parts.hostname or "").rstrip(".")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    path = parts.path.rstrip("/")
+    if get_domain(host) in PATH_BASED_HOSTS:
+        return f"{scheme}://{host}{path}" + (f"?{parts.query}" if parts.query else "")
+    page = path.lstrip("/").lower()
+    page = page.rsplit(".", 1)[0] if page.endswith((".html", ".htm", ".php", ".asp", ".aspx")) else page
+    if "/" in page or page not in PLAIN_PAGES | {""}:
+        return f"{scheme}://{host}{path}"
+    return f"{scheme}://{host}"
+
+
+def site_key(website):
+    """
+    Key a site is grouped and cached under: its canonical URL without scheme and
+    www., so 'http://www.acme.com/' and 'acme.com/about' share one, but
+    shop.acme.com, acme.wordpress.com or facebook.com/acme each get their own.
+    """
+    host, sep, path = canonical_url(website).split("//", 1)[1].partition("/")
+    return (host[4:] if host.startswith("www.") else host) + sep + path
+
+
+def registrable_domain(website):
+    """Domain a site is registered under: shop.acme.co.uk -> acme.co.uk. IP addresses are returned as is."""
+    host = get_domain(website)
+    labels = host.split(".")
+    if len(labels) <= 2 or host.replace(".", "").isdigit():
+        return host
+    if ".".join(labels[-2:]) in MULTI_PART_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def group_websites(websites):
+    """
+    Group input lines by site_key so each site is crawled once.
+    Returns (targets, members): targets[i] is the canonical URL to crawl (that of the
+    first line of the site) and members[i] the indices of every input line in it.
+    """
+    targets, members, slot = [], [], {}
+    for idx, website in enumerate(websites):
+        key = site_key(website)
+        if key not in slot:
+            slot[key] = len(targets)
+            targets.append(canonical_url(website))
+            members.append([])
+        members[slot[key]].append(idx)
+    return targets, members
+
+
+def google_search_email(driver, website, wait_time=5, exclude_list=None, probe=None):
     """Perform a Google search for '"domain" email' and extract emails from the results."""
     domain = get_domain(website)
     query = f'"{domain}" email'
-    google_url = "https://www.google.com/search?q=" + query.replace(" ", "+")
+    google_url = GOOGLE_SEARCH_URL.format(query=query.replace(" ", "+"))
     try:
-        driver.get(google_url)
-        time.sleep(wait_time)
-        return extract_emails_from_source(driver.page_source, exclude_list)
-    except Exception:
+        return load_in_browser(driver, google_url, wait_time, exclude_list, probe)
+    except Exception as e:
+        note_error(probe, e)
         return set()
 
 
-def extract_emails_for_website(driver, website, show_all=False, contact_suffixes=None, exclude_list=None):
+# Strategy names, in waterfall order, as used in metrics and the result cache
+STRATEGIES = ["main_page", "discovered_page", "contact_suffix", "contact_link", "contact_href",
+              "about_page", "mailto", "facebook", "google"]
+
+# Upper bounds (seconds) of the strategy latency histogram buckets
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 60]
+
+
+def note_error(probe, error):
+    """Count an error that a fetch helper swallowed against the current strategy probe."""
+    if probe is not None:
+        probe["errors"] += 1
+        probe["last_error"] = str(error)[:200]
+
+
+class CrawlMetrics:
+    """
+    Thread-safe per-strategy instrumentation: attempts, hits, latency, page bytes
+    and errors, aggregated per strategy and (optionally) kept per site.
+    Exported as a JSON summary and a Prometheus text file.
+    """
+
+    def __init__(self, keep_sites=True):
+        self.keep_sites = keep_sites
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.sites = 0
+        self.sites_with_emails = 0
+        self.site_errors = 0
+        self.dead_sites = 0
+        self.strategies = {name: self._empty() for name in STRATEGIES}
+        self.site_records = []
+
+    @staticmethod
+    def _empty():
+        return {"attempts": 0, "hits": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0,
+                "bytes": 0, "buckets": [0] * len(LATENCY_BUCKETS)}
+
+    @contextmanager
+    def probe(self, website, strategy):
+        """Time one strategy attempt; the body sets probe["hit"] and the fetch helpers add bytes/errors."""
+        probe = {"hit": False, "bytes": 0, "errors": 0, "last_error": None}
+        start = time.perf_counter()
+        try:
+            yield probe
+        except Exception as e:
+            note_error(probe, e)
+            raise
+        finally:
+            self.record(website, strategy, time.perf_counter() - start, probe)
+
+    def record(self, website, strategy, seconds, probe):
+        with self.lock:
+            stats = self.strategies.setdefault(strategy, self._empty())
+            stats["attempts"] += 1
+            stats["hits"] += 1 if probe["hit"] else 0
+            stats["errors"] += probe["errors"]
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["bytes"] += probe["bytes"]
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats["buckets"][i] += 1
+            if self.keep_sites:
+                self.site_records.append({
+                    "website": website, "strategy": strategy, "seconds": round(seconds, 3),
+                    "hit": probe["hit"], "bytes": probe["bytes"], "errors": probe["errors"],
+                    "last_error": probe["last_error"],
+                })
+
+    def record_site(self, found, error=False):
+        with self.lock:
+            self.sites += 1
+            self.sites_with_emails += 1 if found else 0
+            if error == DEAD_DOMAIN:
+                self.dead_sites += 1
+            elif error:
+                self.site_errors += 1
+
+    def summary(self):
+        with self.lock:
+            strategies = {}
+            for name, stats in self.strategies.items():
+                attempts = stats["attempts"]
+                strategies[name] = {
+                    "attempts": attempts,
+                    "hits": stats["hits"],
+                    "hit_rate": round(stats["hits"] / attempts, 4) if attempts else 0.0,
+                    "errors": stats["errors"],
+                    "total_seconds": round(stats["seconds"], 3),
+                    "avg_seconds": round(stats["seconds"] / attempts, 3) if attempts else 0.0,
+                    "max_seconds": round(stats["max_seconds"], 3),
+                    "page_bytes": stats["bytes"],
+                }
+            summary = {
+                "elapsed_seconds": round(time.time() - self.started, 3),
+                "sites": self.sites,
+                "sites_with_emails": self.sites_with_emails,
+                "site_errors": self.site_errors,
+                "dead_sites": self.dead_sites,
+                "strategies": strategies,
+            }
+            if self.keep_sites:
+                summary["site_records"] = list(self.site_records)
+            return summary
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def write_prometheus(self, path):
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP emailcrawler_{name} {help_text}")
+            lines.append(f"# TYPE emailcrawler_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"emailcrawler_{name}{labels} {value}")
+
+        with self.lock:
+            metric("sites_total", "counter", "Sites processed.", [("", self.sites)])
+            metric("sites_with_emails_total", "counter", "Sites where at least one email was found.",
+                   [("", self.sites_with_emails)])
+            metric("site_errors_total", "counter", "Sites that failed with an error.", [("", self.site_errors)])
+            metric("dead_sites_total", "counter", "Sites skipped because their domain has no DNS records.",
+                   [("", self.dead_sites)])
+            items = list(self.strategies.items())
+            for key, name, help_text in [
+                ("attempts", "strategy_attempts_total", "Strategy attempts."),
+                ("hits", "strategy_hits_total", "Strategy attempts that found emails."),
+                ("errors", "strategy_errors_total", "Errors swallowed during strategy attempts."),
+                ("bytes", "strategy_page_bytes_total", "Page bytes loaded by strategy attempts."),
+            ]:
+                metric(name, "counter", help_text, [(f'{{strategy="{s}"}}', st[key]) for s, st in items])
+            lines.append("# HELP emailcrawler_strategy_duration_seconds Strategy attempt latency.")
+            lines.append("# TYPE emailcrawler_strategy_duration_seconds histogram")
+            for s, st in items:
+                for bound, count in zip(LATENCY_BUCKETS, st["buckets"]):
+                    lines.append(f'emailcrawler_strategy_duration_seconds_bucket{{strategy="{s}",le="{bound}"}} {count}')
+                lines.append(f'emailcrawler_strategy_duration_seconds_bucket{{strategy="{s}",le="+Inf"}} {st["attempts"]}')
+                lines.append(f'emailcrawler_strategy_duration_seconds_sum{{strategy="{s}"}} {st["seconds"]:.6f}')
+                lines.append(f'emailcrawler_strategy_duration_seconds_count{{strategy="{s}"}} {st["attempts"]}')
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def export(self, prefix):
+        """Write <prefix>.json and <prefix>.prom; returns the two paths."""
+        self.write_json(prefix + ".json")
+        self.write_prometheus(prefix + ".prom")
+        return prefix + ".json", prefix + ".prom"
+
+
+class _NoMetrics(CrawlMetrics):
+    """Stand-in used when no metrics are collected."""
+
+    def record(self, website, strategy, seconds, probe):
+        pass
+
+    def record_site(self, found, error=False):
+        pass
+
+
+NO_METRICS = _NoMetrics(keep_sites=False)
+
+
+class StrategyPlanner:
+    """
+    Orders the probes of the web stage (strategies 1.5-5 and each contact suffix) by
+    expected emails per second, from running hit-rate and cost statistics, and skips
+    probes that practically never hit. Skipped probes are still retried every
+    explore_every-th time so their statistics can recover.
+    With pinned=True the configured order is kept and nothing is skipped.
+    """
+
+    def __init__(self, pinned=False, min_samples=20, skip_hit_rate=0.02, explore_every=20):
+        self.pinned = pinned
+        self.min_samples = min_samples
+        self.skip_hit_rate = skip_hit_rate
+        self.explore_every = explore_every
+        self.lock = threading.Lock()
+        self.stats = {}  # key -> [attempts, hits, seconds]
+        self.skips = {}  # key -> times skipped since last tried
+
+    def record(self, key, seconds, hit):
+        with self.lock:
+            stats = self.stats.setdefault(key, [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += 1 if hit else 0
+            stats[2] += seconds
+
+    def score(self, key):
+        """Expected emails per second, with a small prior so new probes get a fair chance."""
+        attempts, hits, seconds = self.stats.get(key, (0, 0, 0.0))
+        hit_rate = (hits + 1) / (attempts + 2)
+        cost = (seconds + 1.0) / (attempts + 1)
+        return hit_rate / cost
+
+    def _skip(self, key):
+        attempts, hits, _ = self.stats.get(key, (0, 0, 0.0))
+        if attempts < self.min_samples or hits / attempts >= self.skip_hit_rate:
+            return False
+        skipped = self.skips.get(key, 0) + 1
+        if skipped >= self.explore_every:
+            self.skips[key] = 0
+            return False
+        self.skips[key] = skipped
+        return True
+
+    def plan(self, prefix, names):
+        """Return names (keys are prefix + name) in the order to try them, minus skipped ones."""
+        if self.pinned:
+            return list(names)
+        with self.lock:
+            kept = [name for name in names if not self._skip(prefix + name)]
+            return sorted(kept, key=lambda name: -self.score(prefix + name))
+
+    def load(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self.lock:
+            for key, value in data.items():
+                self.stats[key] = [int(value[0]), int(value[1]), float(value[2])]
+
+    def save(self, path):
+        with self.lock:
+            data = dict(self.stats)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+# Strategies 1.5-5: the web stage the planner may reorder. The main page always
+# comes first (it builds the link index) and Facebook/Google stay last, because
+# a web address always outranks them when picking the best candidate.
+WEB_STAGE = ["discovered_page", "contact_suffix", "contact_link", "contact_href", "about_page", "mailto"]
+
+
+def extract_emails_for_website(driver, website, show_all=False, contact_suffixes=None, exclude_list=None,
+                               fetcher=None, info=None, metrics=None, planner=None):
     """
     Attempts several strategies to extract emails for a given website.
+    If fetcher (an HttpFetcher) is given, page probes go over plain HTTP first and
+    only fall back to the browser for JS-rendered or blocked pages.
+    If info (a dict) is given, info["strategy"] is set to the name of the strategy that found the emails
+    and info["errors"] to the number of errors the strategies swallowed (failed fetches, dead browser...).
+    If metrics (a CrawlMetrics) is given, every strategy attempt is timed and recorded in it.
+    If planner (a StrategyPlanner) is given, it orders (and may skip) strategies 1.5-5 and the
+    contact suffixes; otherwise they run in the fixed order below.
     Returns either:
       - A list of (email, source) if show_all = True,
       - A single (best_email, source) if show_all = False
     """
+    if metrics is None:
+        metrics = NO_METRICS
+    if contact_suffixes is None:
+        contact_suffixes = [s.strip() for s in DEFAULT_CONTACT_SUFFIXES.split(",")]
     candidate_emails = []  # List of tuples (email, source)
+    strategy = None
+    errors = 0
+    visited = {website.rstrip("/")}
 
-    # Strategy 1: Main page
-    emails = try_url(driver, website, exclude_list=exclude_list)
-    if emails:
-        candidate_emails.extend([(email, "web") for email in emails])
+    @contextmanager
+    def probe_strategy(name):
+        """metrics.probe for one strategy, also adding its errors to the site's count."""
+        nonlocal errors
+        with metrics.probe(website, name) as probe:
+            try:
+                yield probe
+            finally:
+                errors += probe["errors"]
 
-    # Strategy 2: Contact URL variants
-    if not candidate_emails:
-        if contact_suffixes is None:
-            contact_suffixes = [s.strip() for s in DEFAULT_CONTACT_SUFFIXES.split(",")]
-        for suffix in contact_suffixes:
-            url_contact = website.rstrip("/") + suffix
-            emails = try_url(driver, url_contact, exclude_list=exclude_list)
-            if emails:
-                candidate_emails.extend([(email, "web") for email in emails])
-                break
+    def probe_url(url, probe, http=True):
+        """try_url once per URL and site; returns the emails found."""
+        if url.rstrip("/") in visited:
+            return set()
+        visited.add(url.rstrip("/"))
+        return try_url(driver, url, exclude_list=exclude_list, fetcher=fetcher if http else None, probe=probe)
 
-    # Strategy 3: Click on contact link from main page
-    if not candidate_emails:
-        emails = click_contact_link(driver, exclude_list=exclude_list)
+    def probe_many(urls, probe, on_done=None):
+        """
+        Probe urls until one yields emails. With the HTTP tier they are all fetched at
+        once and only the pages that need a browser are then tried one by one.
+        """
+        urls = [url for url in dict.fromkeys(urls) if url.rstrip("/") not in visited]
+        pending = urls
+        emails = set()
+        if fetcher is not None and urls:
+            emails, pending = probe_urls_concurrently(fetcher, urls, exclude_list, probe, on_done)
+        if not emails:
+            for url in pending:
+                start = time.perf_counter()
+                emails = probe_url(url, probe, http=False)
+                if on_done:
+                    on_done(url, time.perf_counter() - start, bool(emails))
+                if emails:
+                    break
+        visited.update(url.rstrip("/") for url in urls)
+        return emails
+
+    # Strategy 1: Main page (also indexes its links for strategies 1.5-5)
+    with probe_strategy("main_page") as probe:
+        emails, links = load_main_page(driver, website, exclude_list=exclude_list, fetcher=fetcher, probe=probe)
         if emails:
             candidate_emails.extend([(email, "web") for email in emails])
+            strategy = "main_page"
+            probe["hit"] = True
+
+    # Strategy 1.5: Contact/about pages found through the homepage links and the sitemap
+    def discovered_page(probe):
+        return probe_many(discover_pages(website, links, fetcher), probe)
+
+    # Strategy 2: Contact URL variants
+    def contact_suffix(probe):
+        order = planner.plan("suffix:", contact_suffixes) if planner else contact_suffixes
+        suffix_of = {website.rstrip("/") + suffix: suffix for suffix in order}
+
+        def done(url, seconds, hit):
+            if planner:
+                planner.record("suffix:" + suffix_of[url], seconds, hit)
+
+        return probe_many(list(suffix_of), probe, done)
+
+    # Strategy 3: Follow contact link from main page
+    def contact_link(probe):
+        for href in links["contact_text"][:1]:
+            return probe_url(href, probe)
+        return set()
 
     # Strategy 3.5: Alternative contact link (href)
-    if not candidate_emails:
-        try:
-            domain = get_domain(website)
-            xpath_expr = f"//a[contains(translate(@href, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'contact') and contains(@href, '{domain}')]"
-            links = driver.find_elements(By.XPATH, xpath_expr)
-            for link in links:
-                href = link.get_attribute("href")
-                if href:
-                    link.click()
-                    time.sleep(5)
-                    emails = extract_emails_from_source(driver.page_source, exclude_list)
-                    if emails:
-                        candidate_emails.extend([(email, "web") for email in emails])
-                        break
-        except Exception:
-            pass
+    def contact_href(probe):
+        for href in links["contact_href"]:
+            emails = probe_url(href, probe)
+            if emails:
+                return emails
+        return set()
 
-    # Strategy 4: About page variants
-    if not candidate_emails:
-        for suffix in ["/about", "/about-us"]:
-            url_about = website.rstrip("/") + suffix
-            emails = try_url(driver, url_about, exclude_list=exclude_list)
+    # Strategy 4: About page variants, preferring about links found on the main page
+    def about_page(probe):
+        about_urls = links["about"] + [website.rstrip("/") + suffix for suffix in ["/about", "/about-us"]]
+        about_urls = [url for url in dict.fromkeys(about_urls) if url.rstrip("/") not in visited]
+        for url_about in about_urls[:2]:
+            emails = probe_url(url_about, probe)
             if emails:
-                candidate_emails.extend([(email, "web") for email in emails])
-                break
+                return emails
+        return set()
 
-    # Strategy 5: Look for mailto: links
-    if not candidate_emails:
-        try:
-            mailto_links = driver.find_elements(By.XPATH, "//a[starts-with(@href, 'mailto:')]")
-            for ml in mailto_links:
-                href = ml.get_attribute("href")
-                if href:
-                    email = href.split("mailto:")[-1]
-                    candidate_emails.append((email, "web"))
-        except Exception:
-            pass
+    # Strategy 5: mailto: links from the main page
+    def mailto(probe):
+        return links["mailto"]
+
+    stages = {"discovered_page": discovered_page, "contact_suffix": contact_suffix, "contact_link": contact_link,
+              "contact_href": contact_href, "about_page": about_page, "mailto": mailto}
+    for name in (planner.plan("strategy:", WEB_STAGE) if planner else WEB_STAGE):
+        if candidate_emails:
+            break
+        with probe_strategy(name) as probe:
+            start = time.perf_counter()
+            emails = stages[name](probe)
+            if planner:
+                planner.record("strategy:" + name, time.perf_counter() - start, bool(emails))
+            if emails:
+                candidate_emails.extend([(email, "web") for email in emails])
+                strategy = name
+                probe["hit"] = True
 
     # Strategy 6: Facebook page
     if not candidate_emails:
-        try:
-            domain = get_domain(website)
-            domain_clean = domain.lower().replace("www.", "")
-            base_name = domain_clean.split('.')[0]
-            fb_url = f"https://www.facebook.com/{base_name}"
-            emails = try_url(driver, fb_url, wait_time=7, exclude_list=exclude_list)
-            if emails:
-                candidate_emails.extend([(email, "facebook") for email in emails])
-        except Exception:
-            pass
+        with probe_strategy("facebook") as probe:
+            try:
+                domain = get_domain(website)
+                domain_clean = domain.lower().replace("www.", "")
+                base_name = domain_clean.split('.')[0]
+                fb_url = FACEBOOK_URL.format(name=base_name)
+                emails = try_url(driver, fb_url, wait_time=7, exclude_list=exclude_list, probe=probe)
+                if emails:
+                    candidate_emails.extend([(email, "facebook") for email in emails])
+                    strategy = "facebook"
+                    probe["hit"] = True
+            except Exception as e:
+                note_error(probe, e)
 
     # Strategy 7: Google search
     if not candidate_emails:
-        emails = google_search_email(driver, website, exclude_list=exclude_list)
-        if emails:
-            candidate_emails.extend([(email, "google") for email in emails])
+        with probe_strategy("google") as probe:
+            emails = google_search_email(driver, website, exclude_list=exclude_list, probe=probe)
+            if emails:
+                candidate_emails.extend([(email, "google") for email in emails])
+                strategy = "google"
+                probe["hit"] = True
+
+    if info is not None:
+        info["strategy"] = strategy
+        info["errors"] = errors
+    return select_result(website, candidate_emails, show_all)
 
+
+def select_result(website, candidate_emails, show_all=False):
+    """Turn a list of (email, source) candidates into the result shape of extract_emails_for_website."""
     if not candidate_emails:
         return None
 
@@ -179,7 +1249,6 @@ def extract_emails_for_website(driver, website, show_all=False, contact_suffixes
 
     # Single best candidate
     domain = get_domain(website).lower().replace("www.", "")
-    from difflib import SequenceMatcher
     def similarity(email):
         local = email.split("@")[0].lower()
         return SequenceMatcher(None, domain, local).ratio()
@@ -192,7 +1261,398 @@ def extract_emails_for_website(driver, website, show_all=False, contact_suffixes
     return (best_candidate[0] + mark_star, best_candidate[1])
 
 
-def iniciar_driver(headless=False):
+class ResultCache:
+    """
+    On-disk SQLite cache of crawl results keyed by site_key. Every finished site is
+    written immediately, so an interrupted run resumes by skipping fresh entries.
+    """
+
+    def __init__(self, path, ttl_days=30):
+        self.ttl = ttl_days * 86400
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " domain TEXT PRIMARY KEY,"
+            " website TEXT,"
+            " emails TEXT,"
+            " strategy TEXT,"
+            " crawled_at REAL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def key(website):
+        return site_key(website)
+
+    def get(self, website):
+        """Return the cached list of (email, source) for website, or None if missing or expired."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT emails, crawled_at FROM results WHERE domain = ?", (self.key(website),)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return [tuple(pair) for pair in json.loads(row[0])]
+
+    def put(self, website, candidate_emails, strategy=None):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (domain, website, emails, strategy, crawled_at) VALUES (?, ?, ?, ?, ?)",
+                (self.key(website), website, json.dumps(candidate_emails or []), strategy, time.time())
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+# Shared job queue: how long a claimed site stays leased without a heartbeat, how
+# often workers renew their leases, how often idle workers and collectors poll, and
+# how many times a site is claimed before it is given up as failed
+JOB_LEASE_SECONDS = 300
+JOB_HEARTBEAT_SECONDS = 60
+JOB_POLL_SECONDS = 5
+JOB_MAX_ATTEMPTS = 3
+
+
+class JobQueue:
+    """
+    Durable crawl job queue in a SQLite file, so any number of crawler processes
+    (on this host or on others sharing the file) can split one list of sites.
+    claim() leases sites to a worker, which renews its leases with heartbeat();
+    a lease that runs out (worker crashed or hung) puts the site back in the queue,
+    up to max_attempts claims. complete() writes each result back and results() /
+    stream() give them to a coordinator in completion order.
+    On shared storage the file needs working file locks; the default rollback
+    journal is kept because WAL mode does not work over network filesystems.
+    """
+
+    def __init__(self, path, lease_seconds=JOB_LEASE_SECONDS, max_attempts=JOB_MAX_ATTEMPTS):
+        self.lease = lease_seconds
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        # Explicit transactions: BEGIN IMMEDIATE takes the write lock up front, so two
+        # processes never claim the same site
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False, isolation_level=None)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id INTEGER PRIMARY KEY,"
+            " website TEXT NOT NULL,"
+            " state TEXT NOT NULL DEFAULT 'pending',"
+            " worker TEXT,"
+            " lease_until REAL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " result TEXT,"
+            " error TEXT)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, lease_until)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_worker ON jobs (worker)")
+        # Append-only log of finished jobs: its seq is the completion order
+        self.conn.execute("CREATE TABLE IF NOT EXISTS done (seq INTEGER PRIMARY KEY AUTOINCREMENT, job_id INTEGER)")
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def add(self, websites, batch=1000):
+        """Queue websites (any iterable, read lazily); returns how many were added."""
+        added = 0
+        rows = []
+        for website in websites:
+            rows.append((website,))
+            if len(rows) >= batch:
+                added += self._insert(rows)
+                rows = []
+        return added + (self._insert(rows) if rows else 0)
+
+    def _insert(self, rows):
+        with self.transaction() as conn:
+            conn.executemany("INSERT INTO jobs (website) VALUES (?)", rows)
+        return len(rows)
+
+    def claim(self, worker, count=1):
+        """Lease up to count sites to worker, pending ones first; returns [(job_id, website)]."""
+        now = time.time()
+        with self.transaction() as conn:
+            # Leases that ran out on their last attempt: give the site up
+            expired = "state = 'leased' AND lease_until < ? AND attempts >= ?"
+            conn.execute(f"INSERT INTO done (job_id) SELECT id FROM jobs WHERE {expired}", (now, self.max_attempts))
+            conn.execute(f"UPDATE jobs SET state = 'done', error = 'failed' WHERE {expired}", (now, self.max_attempts))
+            rows = conn.execute(
+                "SELECT id, website FROM jobs WHERE state = 'pending' ORDER BY id LIMIT ?", (count,)
+            ).fetchall()
+            if len(rows) < count:
+                rows += conn.execute(
+                    "SELECT id, website FROM jobs WHERE state = 'leased' AND lease_until < ? ORDER BY id LIMIT ?",
+                    (now, count - len(rows))
+                ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET state = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                [(worker, now + self.lease, job_id) for job_id, _ in rows]
+            )
+        return rows
+
+    def heartbeat(self, worker):
+        """Renew every lease held by worker; returns how many it holds."""
+        with self.transaction() as conn:
+            return conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE worker = ? AND state = 'leased'",
+                (time.time() + self.lease, worker)
+            ).rowcount
+
+    def complete(self, job_id, worker, result, error=False):
+        """
+        Store the result of a leased site. Returns False (and stores nothing) if the
+        lease was lost to another worker meanwhile.
+        """
+        code = "dead" if error == DEAD_DOMAIN else "error" if error else None
+        with self.transaction() as conn:
+            updated = conn.execute(
+                "UPDATE jobs SET state = 'done', result = ?, error = ?, lease_until = NULL"
+                " WHERE id = ? AND worker = ? AND state = 'leased'",
+                (json.dumps(result), code, job_id, worker)
+            ).rowcount
+            if updated:
+                conn.execute("INSERT INTO done (job_id) VALUES (?)", (job_id,))
+        return bool(updated)
+
+    def release(self, worker):
+        """Put the sites still leased by worker back in the queue (clean shutdown)."""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET state = 'pending', worker = NULL, lease_until = NULL, attempts = attempts - 1"
+                " WHERE worker = ? AND state = 'leased'", (worker,)
+            )
+
+    def counts(self):
+        """Number of jobs per state (pending, leased, done)."""
+        with self.lock:
+            rows = self.conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return {"pending": 0, "leased": 0, "done": 0, **dict(rows)}
+
+    def unfinished(self, worker=None):
+        """Pending plus leased jobs; with worker, the leases it holds itself are not counted."""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE state = 'pending' OR (state = 'leased' AND worker IS NOT ?)",
+                (worker,)
+            ).fetchone()[0]
+
+    @staticmethod
+    def _result(value):
+        """Undo the JSON round trip: a (email, source) tuple or a list of them."""
+        value = json.loads(value) if value else None
+        if not value:
+            return value
+        return [tuple(pair) for pair in value] if isinstance(value[0], list) else tuple(value)
+
+    def results(self, after=0, limit=1000):
+        """
+        Finished jobs after completion number 'after', as
+        (seq, job_id, website, result, error) with error False, True or DEAD_DOMAIN.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT done.seq, jobs.id, jobs.website, jobs.result, jobs.error FROM done"
+                " JOIN jobs ON jobs.id = done.job_id WHERE done.seq > ? ORDER BY done.seq LIMIT ?",
+                (after, limit)
+            ).fetchall()
+        return [(seq, job_id, website, self._result(result),
+                 DEAD_DOMAIN if error == "dead" else bool(error))
+                for seq, job_id, website, result, error in rows]
+
+    def stream(self, poll=JOB_POLL_SECONDS):
+        """Yield (job_id, website, result, error) as jobs finish, until the whole queue is done."""
+        after = 0
+        while True:
+            finished = not self.unfinished()
+            rows = self.results(after)
+            for after, job_id, website, result, error in rows:
+                yield job_id, website, result, error
+            if not rows:
+                if finished:
+                    return
+                time.sleep(poll)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+# DNS prefilter: sites resolved per batch, parallel lookups, seconds per lookup and
+# how long a definite answer is reused
+LIVENESS_BATCH = 64
+LIVENESS_CONCURRENCY = 32
+LIVENESS_TIMEOUT = 3.0
+LIVENESS_TTL = 3600
+# hosts whose status LivenessChecker remembers (least recently used go first)
+LIVENESS_CACHE_SIZE = 50000
+# error value passed to on_result for sites skipped by the prefilter
+DEAD_DOMAIN = "dead"
+
+
+class DnsResolver:
+    """
+    Default resolver for LivenessChecker. resolve(host, rdtype) returns the records
+    (empty if the name or the record type does not exist) and raises if the lookup
+    itself failed (timeout, SERVFAIL). nameservers/port can point at any server,
+    e.g. a local stub. Without dnspython, A/AAAA go through getaddrinfo and MX is
+    reported as empty.
+    Any object with the same coroutine can be passed to LivenessChecker instead.
+    """
+
+    def __init__(self, nameservers=None, port=53, timeout=LIVENESS_TIMEOUT):
+        self.nameservers = nameservers
+        self.port = port
+        self.timeout = timeout
+        self.resolvers = weakref.WeakKeyDictionary()
+
+    def _resolver(self):
+        # One per event loop (LivenessChecker runs every batch on a fresh loop), so
+        # the system config is read once per batch rather than once per lookup
+        loop = asyncio.get_running_loop()
+        resolver = self.resolvers.get(loop)
+        if resolver is None:
+            resolver = self.resolvers[loop] = self._new_resolver()
+        return resolver
+
+    def _new_resolver(self):
+        resolver = dns.asyncresolver.Resolver(configure=not self.nameservers)
+        if self.nameservers:
+            resolver.nameservers = list(self.nameservers)
+        resolver.port = self.port
+        resolver.lifetime = self.timeout
+        return resolver
+
+    async def resolve(self, host, rdtype):
+        if dns is not None:
+            try:
+                answer = await self._resolver().resolve(host, rdtype, search=False)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                return []
+            return [rr.to_text() for rr in answer]
+        if rdtype == "MX":
+            return []
+        family = socket.AF_INET if rdtype == "A" else socket.AF_INET6
+        try:
+            infos = await asyncio.wait_for(
+                asyncio.get_running_loop().getaddrinfo(host, None, family=family, type=socket.SOCK_STREAM),
+                self.timeout
+            )
+        except socket.gaierror as e:
+            if e.errno in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)):
+                return []
+            raise
+        return [info[4][0] for info in infos]
+
+
+class LivenessChecker:
+    """
+    Resolves many sites concurrently (at most `concurrency` lookups at once) and caches
+    the answers of the last cache_size hosts: A and AAAA of the host, MX of its
+    registrable domain (mail lives there, not on www.acme.com) and, if those are all
+    empty, A and AAAA of the domain. A site is "dead" when every lookup definitely came
+    back empty, "alive" when any record exists and "unknown" when a lookup failed; only
+    dead sites are skipped, so a flaky DNS never drops a lead, and a host without
+    records of a live domain still gets the Facebook and Google strategies.
+    """
+
+    def __init__(self, resolver=None, concurrency=LIVENESS_CONCURRENCY, ttl=LIVENESS_TTL,
+                 cache_size=LIVENESS_CACHE_SIZE):
+        self.resolver = resolver or DnsResolver()
+        self.concurrency = concurrency
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self.cache = OrderedDict()
+
+    def cached(self, host):
+        with self.lock:
+            entry = self.cache.get(host)
+            if entry is None:
+                return None
+            if time.time() - entry[1] > self.ttl:
+                del self.cache[host]
+                return None
+            self.cache.move_to_end(host)
+        return entry[0]
+
+    def remember(self, host, state):
+        with self.lock:
+            self.cache[host] = (state, time.time())
+            self.cache.move_to_end(host)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    async def _lookup(self, host, rdtype, sem):
+        async with sem:
+            return await self.resolver.resolve(host, rdtype)
+
+    async def _check(self, host, sem):
+        domain = registrable_domain(host)
+        lookups = [(host, "A"), (host, "AAAA"), (domain, "MX")]
+        answers = await asyncio.gather(
+            *(self._lookup(name, rdtype, sem) for name, rdtype in lookups), return_exceptions=True
+        )
+        if domain != host and not any(answer and not isinstance(answer, BaseException) for answer in answers):
+            answers += await asyncio.gather(
+                *(self._lookup(domain, rdtype, sem) for rdtype in ("A", "AAAA")), return_exceptions=True
+            )
+        if any(answer and not isinstance(answer, BaseException) for answer in answers):
+            return "alive"
+        if any(isinstance(answer, BaseException) for answer in answers):
+            return "unknown"
+        return "dead"
+
+    async def _check_all(self, hosts):
+        sem = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(*(self._check(host, sem) for host in hosts))
+
+    def check_many(self, websites):
+        """Status ("alive", "dead" or "unknown") of each website, in order."""
+        hosts = [urlsplit(canonical_url(website)).hostname or "" for website in websites]
+        statuses = {host: self.cached(host) for host in hosts}
+        pending = [host for host, state in statuses.items()
+                   if state is None and host and not host.replace(".", "").isdigit() and ":" not in host]
+        if pending:
+            for host, state in zip(pending, asyncio.run(self._check_all(pending))):
+                statuses[host] = state
+                if state != "unknown":
+                    self.remember(host, state)
+        return [statuses[host] or "alive" for host in hosts]
+
+    def check(self, website):
+        return self.check_many([website])[0]
+
+
+# GUI log: lines kept in the on-screen log (the full log is spooled to disk) and
+# how often / how many queued events the Tk main loop handles per batch
+MAX_LOG_LINES = 5000
+EVENT_POLL_MS = 100
+EVENT_BATCH = 500
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crawler_cache.sqlite3")
+# Running strategy hit-rate/cost statistics used by StrategyPlanner, kept across runs
+DEFAULT_PLANNER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy_stats.json")
+# Per-run metrics are written to <prefix>.json and <prefix>.prom
+DEFAULT_METRICS_PREFIX = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crawl_metrics")
+
+
+def iniciar_driver(headless=False, lean=False, proxy=None):
+    """
+    Start Chrome. With lean=True the driver uses the eager page-load strategy and
+    blocks images, fonts, media, stylesheets and ad/analytics hosts.
+    With proxy ("http://host:port") all traffic goes through that HTTP proxy.
+    """
     options = uc.ChromeOptions()
     # Se eliminan los argumentos de perfil y directorio de usuario para que funcione en cualquier equipo
     options.add_argument("--start-maximized")
@@ -207,31 +1667,458 @@ def iniciar_driver(headless=False):
     options.add_argument("--log-level=3")
     options.add_argument("--silent")
 
-    options.add_experimental_option("prefs", {
+    prefs = {
         "profile.default_content_setting_values.notifications": 2,
         "credentials_enable_service": False,
         "profile.password_manager_enabled": False
-    })
+    }
+    if lean:
+        prefs["profile.managed_default_content_settings.images"] = 2
+        options.page_load_strategy = "eager"
+    options.add_experimental_option("prefs", prefs)
 
-    user_agent = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                  "AppleWebKit/537.36 (KHTML, like Gecko) "
-                  "Chrome/115.0.0.0 Safari/537.36")
-    options.add_argument(f"--user-agent={user_agent}")
+    options.add_argument(f"--user-agent={USER_AGENT}")
 
     if headless:
         options.add_argument("--headless=new")
+    if proxy:
+        options.add_argument(f"--proxy-server={proxy}")
 
     driver = uc.Chrome(options=options, version_main=132)
-    driver.implicitly_wait(10)
     driver.execute_cdp_cmd(
         "Page.addScriptToEvaluateOnNewDocument",
         {
             "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         }
     )
+    if lean:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+        driver.lean_blocked = LEAN_BLOCKED_URLS
     return driver
 
 
+# uc.Chrome patches the chromedriver binary on startup, so two drivers
+# launched at the same time can clobber each other's copy.
+_DRIVER_INIT_LOCK = threading.Lock()
+
+# Browser recycling: a driver is replaced after this many sites or once Chrome's
+# process tree uses more than this many MB (needs psutil)
+DRIVER_RECYCLE_SITES = 200
+DRIVER_MAX_RSS_MB = 1500
+# times a site is retried on a fresh browser when its browser crashed
+DRIVER_RETRIES = 1
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def driver_alive(driver):
+    """True if the browser session still answers."""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+def driver_rss_mb(driver):
+    """Resident memory of the driver's browser process tree in MB, or None without psutil."""
+    if psutil is None:
+        return None
+    pid = getattr(driver, "browser_pid", None)
+    if not pid:
+        process = getattr(getattr(driver, "service", None), "process", None)
+        pid = getattr(process, "pid", None)
+    try:
+        root = psutil.Process(pid)
+        procs = [root] + root.children(recursive=True)
+    except (psutil.Error, TypeError, ValueError):
+        return None
+    total = 0
+    for proc in procs:
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+
+class DriverManager:
+    """
+    Owns the Chrome drivers for one (headless, lean) profile. prewarm() starts
+    spares in the background so the cold start of uc.Chrome is paid before the
+    run; acquire() hands out a spare (waiting for one that is still starting)
+    or a new driver; release() keeps healthy drivers as spares for the next run.
+    Workers call site_done() after every site to recycle a driver that reached
+    recycle_after sites or max_rss_mb, or whose session died; the worker then
+    acquires a new one when it takes its next site.
+    """
+
+    def __init__(self, headless=False, lean=False, recycle_after=DRIVER_RECYCLE_SITES,
+                 max_rss_mb=DRIVER_MAX_RSS_MB, factory=None):
+        self.factory = factory or iniciar_driver
+        self.recycle_after = recycle_after
+        self.max_rss_mb = max_rss_mb
+        self.profile = (headless, lean)
+        self.cond = threading.Condition()
+        self.spares = []
+        self.warming = 0
+        self.closed = False
+        self.sites = {}  # driver -> sites crawled with it, kept across runs
+
+    def configure(self, headless, lean):
+        """Switch profile; spares started with the old one are shut down."""
+        with self.cond:
+            if (headless, lean) == self.profile:
+                return
+            self.profile = (headless, lean)
+            stale, self.spares = self.spares, []
+        for driver, _ in stale:
+            self.discard(driver)
+
+    def _start(self):
+        profile = self.profile
+        with _DRIVER_INIT_LOCK:
+            driver = self.factory(headless=profile[0], lean=profile[1])
+        return driver, profile
+
+    def _keep(self, driver, profile):
+        """Add driver to the spares if it still fits; otherwise quit it."""
+        with self.cond:
+            keep = not self.closed and profile == self.profile
+            if keep:
+                self.spares.append((driver, profile))
+                self.cond.notify()
+        if not keep:
+            self.discard(driver)
+
+    def prewarm(self, count=1):
+        """Start drivers in a background thread until count spares exist."""
+        with self.cond:
+            missing = max(0, count - len(self.spares) - self.warming)
+            self.warming += missing
+        if not missing:
+            return
+
+        def run():
+            for _ in range(missing):
+                try:
+                    driver, profile = self._start()
+                except Exception:
+                    driver = None
+                with self.cond:
+                    self.warming -= 1
+                    self.cond.notify_all()
+                if driver is not None:
+                    self._keep(driver, profile)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def acquire(self):
+        """A ready driver: a live spare if there is one, else a new one."""
+        while True:
+            with self.cond:
+                while not self.spares and self.warming:
+                    self.cond.wait()
+                spare = self.spares.pop() if self.spares else None
+            if spare is None:
+                return self._start()[0]
+            if spare[1] == self.profile and driver_alive(spare[0]):
+                return spare[0]
+            self.discard(spare[0])
+
+    def needs_recycle(self, driver):
+        with self.cond:
+            sites = self.sites.get(driver, 0)
+        if sites >= self.recycle_after:
+            return True
+        rss = driver_rss_mb(driver) if self.max_rss_mb else None
+        return rss is not None and rss > self.max_rss_mb
+
+    def discard(self, driver):
+        with self.cond:
+            self.sites.pop(driver, None)
+        quit_driver(driver)
+
+    def restart(self, driver):
+        """Replace a dead or worn-out driver."""
+        self.discard(driver)
+        return self.acquire()
+
+    def site_done(self, driver):
+        """Count a finished site; returns driver, or None if it was recycled (acquire a new one on next use)."""
+        with self.cond:
+            self.sites[driver] = self.sites.get(driver, 0) + 1
+        if self.needs_recycle(driver) or not driver_alive(driver):
+            self.discard(driver)
+            return None
+        return driver
+
+    def release(self, driver):
+        """Return a worker's driver at the end of a run."""
+        if driver is None:
+            return
+        if self.needs_recycle(driver) or not driver_alive(driver):
+            self.discard(driver)
+        else:
+            self._keep(driver, self.profile)
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            spares, self.spares = self.spares, []
+        for driver, _ in spares:
+            self.discard(driver)
+
+
+def crawl_stream(websites, num_workers=1, headless=False, show_all=False, contact_suffixes=None,
+                 exclude_list=None, on_status=None, on_result=None, http_first=True, lean=False, cache=None,
+                 metrics=None, planner=None, liveness=None, drivers=None, proxy=None):
+    """
+    Crawl websites (any iterable, consumed lazily) with a pool of num_workers Chrome drivers
+    fed from a bounded work queue. A None from websites means "nothing more for now": the
+    sites held for a DNS batch are dispatched instead of waiting for the batch to fill
+    (None still takes an idx). Nothing is kept in memory: on_result(idx, website, result, error)
+    is called, from a worker thread, as soon as each site finishes, and
+    on_status(worker_id, text) whenever a worker changes state.
+    With http_first, all workers share one pooled HttpFetcher and only use their browser as a fallback.
+    With lean, the drivers use the lean crawl profile (see iniciar_driver).
+    With cache (a ResultCache), fresh cached sites are answered without a browser and new results are stored.
+    With metrics (a CrawlMetrics), every strategy attempt and finished site is recorded.
+    With planner (a StrategyPlanner), strategies 2-5 and the contact suffixes are ordered adaptively.
+    With liveness (a LivenessChecker), sites are resolved in batches first and those with no
+    A/AAAA/MX records are reported with error=DEAD_DOMAIN without reaching a browser.
+    With drivers (a DriverManager, e.g. prewarmed by the GUI), browsers come from it and
+    healthy ones are handed back at the end; otherwise they are started here and quit.
+    Either way a browser is recycled after DRIVER_RECYCLE_SITES sites or DRIVER_MAX_RSS_MB,
+    and one that crashes mid-site is restarted and the site retried DRIVER_RETRIES times.
+    With proxy ("http://host:port"), the HTTP tier and the browsers started here go through it.
+    """
+    num_workers = max(1, num_workers)
+    work = queue.Queue(maxsize=num_workers * 2)
+
+    def status(worker_id, text):
+        if on_status:
+            on_status(worker_id, text)
+
+    def report(idx, website, result, error):
+        if metrics is not None:
+            metrics.record_site(bool(result), error)
+        if on_result:
+            on_result(idx, website, result, error)
+
+    def worker(worker_id):
+        driver = None
+        try:
+            while True:
+                item = work.get()
+                if item is None:
+                    break
+                idx, website = item
+                if driver is None:
+                    # Browsers start on first use, so a fully cached run never launches Chrome
+                    status(worker_id, "Starting browser...")
+                    try:
+                        driver = drivers.acquire()
+                    except Exception:
+                        status(worker_id, "Error initializing driver")
+                        report(idx, website, None, True)
+                        return
+                status(worker_id, f"Processing {website}")
+                result = None
+                error = False
+                for attempt in range(DRIVER_RETRIES + 1):
+                    try:
+                        info = {}
+                        candidates = extract_emails_for_website(
+                            driver, website,
+                            show_all=True,
+                            contact_suffixes=contact_suffixes,
+                            exclude_list=exclude_list,
+                            fetcher=fetcher,
+                            info=info,
+                            metrics=metrics,
+                            planner=planner
+                        )
+                        # The strategies swallow driver errors, so a browser that died
+                        # mid-site only shows up as errors plus a session that no longer answers
+                        if not info.get("errors") or driver_alive(driver):
+                            # A site that found nothing because a fetch failed is not cached as a negative
+                            if cache is not None and (candidates or not info.get("errors")):
+                                cache.put(website, candidates, info.get("strategy"))
+                            result = select_result(website, candidates, show_all)
+                            error = False
+                            break
+                        error = True
+                    except Exception:
+                        error = True
+                        if driver_alive(driver):
+                            break
+                    if attempt == DRIVER_RETRIES:
+                        break
+                    # The browser itself died: start a new one and retry the site
+                    status(worker_id, "Restarting browser...")
+                    try:
+                        driver = drivers.restart(driver)
+                    except Exception:
+                        driver = None
+                        status(worker_id, "Error initializing driver")
+                        report(idx, website, None, True)
+                        return
+                    status(worker_id, f"Processing {website} (retry)")
+                report(idx, website, result, error)
+                try:
+                    driver.delete_all_cookies()
+                except Exception:
+                    pass
+                driver = drivers.site_done(driver)
+        finally:
+            if driver is not None:
+                if owns_drivers:
+                    drivers.discard(driver)
+                else:
+                    drivers.release(driver)
+            status(worker_id, "Idle")
+
+    def put(item):
+        """Queue item; False once every worker has died and nobody will take it."""
+        while any(t.is_alive() for t in threads):
+            try:
+                work.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def dispatch(batch):
+        """Queue a batch of sites, answering the ones the DNS prefilter finds dead right away."""
+        statuses = liveness.check_many([website for _, website in batch]) if liveness is not None and batch else []
+        for i, (idx, website) in enumerate(batch):
+            if statuses and statuses[i] == "dead":
+                report(idx, website, None, DEAD_DOMAIN)
+            elif not put((idx, website)):
+                # No browser could be started
+                report(idx, website, None, True)
+
+    owns_drivers = drivers is None
+    if owns_drivers:
+        drivers = DriverManager(headless=headless, lean=lean,
+                                factory=partial(iniciar_driver, proxy=proxy) if proxy else None)
+    else:
+        drivers.configure(headless, lean)
+    fetcher = HttpFetcher(proxy=proxy) if http_first else None
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(num_workers)]
+    try:
+        for t in threads:
+            t.start()
+        batch = []
+        for idx, website in enumerate(websites):
+            if website is None:
+                dispatch(batch)
+                batch = []
+                continue
+            cached = cache.get(website) if cache is not None else None
+            if cached is not None:
+                report(idx, website, select_result(website, cached, show_all), False)
+                continue
+            batch.append((idx, website))
+            if len(batch) >= (LIVENESS_BATCH if liveness is not None else 1):
+                dispatch(batch)
+                batch = []
+        dispatch(batch)
+        for _ in threads:
+            put(None)
+        for t in threads:
+            t.join()
+    finally:
+        if fetcher is not None:
+            fetcher.close()
+        if owns_drivers:
+            drivers.close()
+
+    # Sites left in the queue mean their workers died before taking them
+    while not work.empty():
+        item = work.get_nowait()
+        if item is not None:
+            report(item[0], item[1], None, True)
+
+
+def crawl_pool(websites, num_workers=1, on_result=None, **kwargs):
+    """
+    Like crawl_stream, but for a list: returns the results in the same order as
+    websites (None for no emails or error).
+    """
+    websites = list(websites)
+    results = [None] * len(websites)
+
+    def collect(idx, website, result, error):
+        results[idx] = result
+        if on_result:
+            on_result(idx, website, result, error)
+
+    crawl_stream(websites, max(1, min(num_workers, len(websites))), on_result=collect, **kwargs)
+    return results
+
+
+def crawl_queue(jobs, worker=None, num_workers=1, on_result=None, **kwargs):
+    """
+    Crawl sites claimed from a JobQueue, with num_workers browsers, until every job
+    in the queue is done, writing each result back to it. worker names this process
+    in the queue (default host:pid); a background thread renews its leases every
+    JOB_HEARTBEAT_SECONDS. Sites claimed but not crawled when the run stops go back
+    to the queue. on_result(job_id, website, result, error) is called for the sites
+    crawled here; other keyword arguments are passed to crawl_stream.
+    """
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    job_ids = {}  # crawl_stream index -> job id
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(JOB_HEARTBEAT_SECONDS):
+            try:
+                jobs.heartbeat(worker)
+            except sqlite3.Error:
+                pass  # storage busy: the next beat is well within the lease
+
+    def claimed():
+        idx = 0
+        while True:
+            batch = jobs.claim(worker, num_workers)
+            if not batch:
+                # Our own leases are already in crawl_stream and finish without us
+                if not jobs.unfinished(worker):
+                    return
+                # Other workers still hold leases; one may expire and come back to us.
+                # Meanwhile crawl_stream must not sit on a partial DNS batch.
+                idx += 1
+                yield None
+                time.sleep(JOB_POLL_SECONDS)
+                continue
+            for job_id, website in batch:
+                job_ids[idx] = job_id
+                idx += 1
+                yield website
+
+    def collect(idx, website, result, error):
+        job_id = job_ids.pop(idx)
+        jobs.complete(job_id, worker, result, error)
+        if on_result:
+            on_result(job_id, website, result, error)
+
+    beat = threading.Thread(target=heartbeat, daemon=True)
+    beat.start()
+    try:
+        crawl_stream(claimed(), num_workers, on_result=collect, **kwargs)
+    finally:
+        stop.set()
+        jobs.release(worker)
+
+
 class EmailCrawlerGUI(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -246,10 +2133,30 @@ class EmailCrawlerGUI(tk.Tk):
 
         self.show_all = tk.BooleanVar(value=False)
         self.headless_mode = tk.BooleanVar(value=False)
+        self.lean_mode = tk.BooleanVar(value=False)
+        self.num_workers = tk.IntVar(value=1)
+        self.http_first = tk.BooleanVar(value=True)
+        self.adaptive_order = tk.BooleanVar(value=True)
+        self.dns_check = tk.BooleanVar(value=True)
         self.contact_suffixes_str = tk.StringVar(value=DEFAULT_CONTACT_SUFFIXES)
         self.excluded_emails_str = tk.StringVar(value=DEFAULT_EXCLUDED_EMAILS)
+        self.cache_ttl_str = tk.StringVar(value="30")
+
+        # Worker threads never touch Tk: they post events that the main loop drains
+        self.events = queue.Queue()
+        self.log_spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+        # Browsers are started in the background now, so the first run skips Chrome's cold start
+        self.drivers = DriverManager(headless=self.headless_mode.get(), lean=self.lean_mode.get())
+        self.drivers.prewarm(self.num_workers.get())
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.create_widgets()
+        self.after(EVENT_POLL_MS, self.drain_events)
+
+    def on_close(self):
+        self.drivers.close()
+        self.destroy()
 
     def create_widgets(self):
         # Websites input area
@@ -278,11 +2185,25 @@ class EmailCrawlerGUI(tk.Tk):
         self.excluded_entry = tk.Entry(excl_frame, textvariable=self.excluded_emails_str, font=("Arial", 10), width=60)
         self.excluded_entry.pack(side=tk.LEFT, padx=5)
 
+        cache_frame = tk.Frame(adv_frame)
+        cache_frame.pack(fill=tk.X, padx=5, pady=2)
+        tk.Label(cache_frame, text="Result cache TTL in days (0 = off):", font=("Arial", 10)).pack(side=tk.LEFT)
+        tk.Entry(cache_frame, textvariable=self.cache_ttl_str, font=("Arial", 10), width=6).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(cache_frame, text="Adaptive strategy order (unchecked: fixed order)",
+                       variable=self.adaptive_order, font=("Arial", 10)).pack(side=tk.LEFT, padx=15)
+        tk.Checkbutton(cache_frame, text="Skip dead domains (DNS check)",
+                       variable=self.dns_check, font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+
         # Checkbuttons for Show All + Headless
         opts_frame = tk.Frame(self)
         opts_frame.pack(fill=tk.X, padx=10, pady=2)
         tk.Checkbutton(opts_frame, text="Show all addresses", variable=self.show_all, font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
         tk.Checkbutton(opts_frame, text="Headless mode (no browser window)", variable=self.headless_mode, font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(opts_frame, text="Lean crawl", variable=self.lean_mode, font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(opts_frame, text="HTTP first", variable=self.http_first, font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+        tk.Label(opts_frame, text="Browsers:", font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+        tk.Spinbox(opts_frame, from_=1, to=os.cpu_count() or 1, textvariable=self.num_workers,
+                   width=4, font=("Arial", 10)).pack(side=tk.LEFT)
 
         # Progress Bar
         progress_frame = tk.Frame(self)
@@ -294,13 +2215,21 @@ class EmailCrawlerGUI(tk.Tk):
         self.progress_label = tk.Label(progress_frame, text="0%", font=("Arial", 10))
         self.progress_label.pack(side=tk.LEFT, padx=5)
 
+        # Per-worker status
+        self.workers_frame = tk.Frame(self)
+        self.workers_frame.pack(fill=tk.X, padx=10)
+        self.worker_labels = []
+
         # Animation label
         self.anim_label = tk.Label(self, text="", font=("Arial", 12, "bold"))
         self.anim_label.pack(pady=5)
 
         # Start Button
-        self.start_button = tk.Button(self, text="Start Crawler", command=self.start_crawler, font=("Arial", 12, "bold"))
-        self.start_button.pack(pady=5)
+        buttons_frame = tk.Frame(self)
+        buttons_frame.pack(pady=5)
+        self.start_button = tk.Button(buttons_frame, text="Start Crawler", command=self.start_crawler, font=("Arial", 12, "bold"))
+        self.start_button.pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons_frame, text="Export Log...", command=self.export_log, font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
 
         # Output Log
         output_frame = tk.LabelFrame(self, text="Output Log", font=("Arial", 12))
@@ -315,6 +2244,59 @@ class EmailCrawlerGUI(tk.Tk):
 
     def clear_output(self):
         self.output_text.delete(1.0, tk.END)
+        self.log_spool.seek(0)
+        self.log_spool.truncate()
+
+    def post(self, kind, *args):
+        """Queue an event for the Tk main loop; safe to call from any thread."""
+        self.events.put((kind,) + args)
+
+    def log(self, text, tag=None):
+        self.post("log", text, tag)
+
+    def drain_events(self):
+        """Apply queued worker events in one batch, then reschedule itself."""
+        logged = False
+        for _ in range(EVENT_BATCH):
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "log":
+                _, text, tag = event
+                self.output_text.insert(tk.END, text, tag)
+                self.log_spool.write(text)
+                logged = True
+            elif kind == "status":
+                _, worker_id, text = event
+                if worker_id < len(self.worker_labels):
+                    self.worker_labels[worker_id].config(text=f"#{worker_id + 1}: {text[:40]}")
+            elif kind == "progress":
+                percent = event[1]
+                self.progress_bar['value'] = percent
+                self.progress_label.config(text=f"{percent}%")
+            elif kind == "done":
+                self.anim_running = False
+                self.start_button.config(state=tk.NORMAL)
+        if logged:
+            # Ring buffer: drop the oldest lines once the on-screen log is over the cap
+            excess = int(self.output_text.index("end-1c").split(".")[0]) - MAX_LOG_LINES
+            if excess > 0:
+                self.output_text.delete("1.0", f"{excess + 1}.0")
+            self.output_text.see(tk.END)
+        self.after(EVENT_POLL_MS, self.drain_events)
+
+    def export_log(self):
+        path = filedialog.asksaveasfilename(title="Export log", defaultextension=".txt",
+                                            filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        self.log_spool.flush()
+        self.log_spool.seek(0)
+        with open(path, "w", encoding="utf-8") as f:
+            shutil.copyfileobj(self.log_spool, f)
+        self.log_spool.seek(0, os.SEEK_END)
 
     def start_crawler(self):
         self.clear_output()
@@ -323,12 +2305,27 @@ class EmailCrawlerGUI(tk.Tk):
         if not self.websites:
             messagebox.showwarning("No websites", "Please enter at least one website.")
             return
+        # Each site is crawled once; its result goes to every line that maps to it
+        self.targets, self.target_members = group_websites(self.websites)
 
         contact_suffixes = [s.strip() for s in self.contact_suffixes_str.get().split(",") if s.strip()]
         excluded_emails = [s.strip().lower() for s in self.excluded_emails_str.get().split(",") if s.strip()]
 
         self.show_all_setting = self.show_all.get()
         self.headless_setting = self.headless_mode.get()
+        self.lean_setting = self.lean_mode.get()
+        self.adaptive_setting = self.adaptive_order.get()
+        self.dns_check_setting = self.dns_check.get()
+        try:
+            self.cache_ttl_setting = max(0.0, float(self.cache_ttl_str.get()))
+        except ValueError:
+            self.cache_ttl_setting = 0.0
+        self.http_first_setting = self.http_first.get()
+        try:
+            self.workers_setting = max(1, int(self.num_workers.get()))
+        except (tk.TclError, ValueError):
+            self.workers_setting = 1
+        self.create_worker_labels(min(self.workers_setting, len(self.targets)))
 
         self.start_button.config(state=tk.DISABLED)
         self.anim_running = True
@@ -339,7 +2336,13 @@ class EmailCrawlerGUI(tk.Tk):
                 self.headless_setting,
                 contact_suffixes,
                 excluded_emails,
-                self.show_all_setting
+                self.show_all_setting,
+                self.workers_setting,
+                self.http_first_setting,
+                self.lean_setting,
+                self.cache_ttl_setting,
+                self.adaptive_setting,
+                self.dns_check_setting
             ),
             daemon=True
         ).start()
@@ -354,78 +2357,116 @@ class EmailCrawlerGUI(tk.Tk):
                 self.anim_label.config(text="")
         update_spinner()
 
-    def run_crawler_gui(self, headless, contact_suffixes, excluded_emails, show_all):
-        results = {}
+    def create_worker_labels(self, count):
+        for label in self.worker_labels:
+            label.destroy()
+        self.worker_labels = []
+        for i in range(count):
+            label = tk.Label(self.workers_frame, text=f"#{i + 1}: Idle", font=("Arial", 9), anchor="w", width=27)
+            label.grid(row=i // 4, column=i % 4, sticky="w")
+            self.worker_labels.append(label)
+
+    def set_worker_status(self, worker_id, text):
+        self.post("status", worker_id, text)
+
+    def run_crawler_gui(self, headless, contact_suffixes, excluded_emails, show_all, num_workers=1, http_first=True, lean=False,
+                        cache_ttl=0, adaptive=True, dns_check=True):
         try:
-            driver = iniciar_driver(headless=headless)
-        except Exception:
-            self.output_text.insert(tk.END, f"Error initializing driver.\n")
-            self.start_button.config(state=tk.NORMAL)
-            self.anim_running = False
-            return
+            total = len(self.targets)
+            done = [0]
+            output_lock = threading.Lock()
+            duplicates = len(self.websites) - total
+            if duplicates:
+                self.log(f"{len(self.websites)} lines -> {total} domains ({duplicates} duplicates merged)\n")
 
-        total = len(self.websites)
-        for idx, website in enumerate(self.websites, start=1):
-            self.output_text.insert(tk.END, f"Processing {website}\n")
-            self.output_text.see(tk.END)
+            def on_result(idx, target, result, error):
+                with output_lock:
+                    for line in self.target_members[idx]:
+                        website = self.websites[line]
+                        if error == DEAD_DOMAIN:
+                            self.log(f"{website} -> Dead domain (no DNS records)\n")
+                        elif error:
+                            self.log(f"{website} -> Error\n")
+                        elif result:
+                            if show_all:
+                                # result is a list of (email, src)
+                                for email, src in result:
+                                    self.log(f"{website} -> ", "normal")
+                                    self.log(f"{email} ({src})\n", src)
+                            else:
+                                email, src = result
+                                self.log(f"{website} -> ", "normal")
+                                self.log(f"{email} ({src})\n", src)
+                        else:
+                            self.log(f"{website} -> No emails found\n")
+
+                    done[0] += 1
+                    percent = int((done[0] / total) * 100)
+                    self.post("progress", percent)
+
+            cache = ResultCache(DEFAULT_CACHE_PATH, cache_ttl) if cache_ttl > 0 else None
+            metrics = CrawlMetrics()
+            planner = StrategyPlanner(pinned=not adaptive)
+            planner.load(DEFAULT_PLANNER_PATH)
+            results = crawl_pool(
+                self.targets, num_workers,
+                headless=headless,
+                show_all=show_all,
+                contact_suffixes=contact_suffixes,
+                exclude_list=excluded_emails,
+                on_status=self.set_worker_status,
+                on_result=on_result,
+                http_first=http_first,
+                lean=lean,
+                cache=cache,
+                metrics=metrics,
+                planner=planner,
+                liveness=LivenessChecker() if dns_check else None,
+                drivers=self.drivers
+            )
+            if cache is not None:
+                cache.close()
+            try:
+                planner.save(DEFAULT_PLANNER_PATH)
+            except OSError:
+                pass
+
+            self.log("\nCrawler finished.\n")
             try:
-                result = extract_emails_for_website(
-                    driver, website,
-                    show_all=show_all,
-                    contact_suffixes=contact_suffixes,
-                    exclude_list=excluded_emails
-                )
-                results[website] = result
-                driver.delete_all_cookies()
+                json_path, prom_path = metrics.export(DEFAULT_METRICS_PREFIX)
+                self.log(f"Metrics written to {json_path} and {prom_path}\n")
+            except OSError:
+                self.log("Could not write the metrics files.\n")
+
+            # 1) Show final list of all webs
+            self.log("WEBS PROCESSED (one per line):\n")
+            for web in self.websites:
+                self.log(f"{web}\n")
+
+            # 2) Show final list of all emails, in color
+            #    We'll combine all addresses into a single list and print them with
+            #    the appropriate color tag.
+            all_emails = []
+            for result in results:
                 if result:
                     if show_all:
-                        # result is a list of (email, src)
-                        for email, src in result:
-                            self.output_text.insert(tk.END, f"{website} -> ", "normal")
-                            self.output_text.insert(tk.END, f"{email} ({src})\n", src)
+                        # result is list of tuples
+                        for (email, src) in result:
+                            all_emails.append((email, src))
                     else:
+                        # single tuple
                         email, src = result
-                        self.output_text.insert(tk.END, f"{website} -> ", "normal")
-                        self.output_text.insert(tk.END, f"{email} ({src})\n", src)
-                else:
-                    self.output_text.insert(tk.END, f"{website} -> No emails found\n")
-            except Exception:
-                self.output_text.insert(tk.END, f"{website} -> Error\n")
-
-            percent = int((idx / total) * 100)
-            self.progress_bar['value'] = percent
-            self.progress_label.config(text=f"{percent}%")
-            self.update_idletasks()
-
-        driver.quit()
-        self.anim_running = False
-        self.output_text.insert(tk.END, "\nCrawler finished.\n")
-
-        # 1) Show final list of all webs
-        self.output_text.insert(tk.END, "WEBS PROCESSED (one per line):\n")
-        for web in self.websites:
-            self.output_text.insert(tk.END, f"{web}\n")
-
-        # 2) Show final list of all emails, in color
-        #    We'll combine all addresses into a single list and print them with
-        #    the appropriate color tag.
-        all_emails = []
-        for web, result in results.items():
-            if result:
-                if show_all:
-                    # result is list of tuples
-                    for (email, src) in result:
                         all_emails.append((email, src))
-                else:
-                    # single tuple
-                    email, src = result
-                    all_emails.append((email, src))
-
-        if all_emails:
-            self.output_text.insert(tk.END, "\nEMAILS:\n")
-            for (email, src) in all_emails:
-                self.output_text.insert(tk.END, email + "\n", src)
-        self.start_button.config(state=tk.NORMAL)
+
+            if all_emails:
+                self.log("\nEMAILS:\n")
+                for (email, src) in all_emails:
+                    self.log(email + "\n", src)
+        except Exception:
+            self.log("\nCrawler stopped by an error:\n" + traceback.format_exc())
+        finally:
+            # Always re-enable Start and stop the spinner, even if the run failed early
+            self.post("done")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+lineas_aba.py
+
+Lectura de ficheros para los scripts ABA (TEMP1, TEMP11, TEMP22 y abaCLI): mmap,
+detección de codificación (UTF-8 con BOM o Latin-1) y corte en líneas con las
+mismas reglas que el modo texto de Python.
+
+Las líneas ASCII se devuelven como bytes, sin decodificar, y el resto como str. Un
+bloque o línea solo cuenta como ASCII "simple" si además no tiene los separadores
+\\x1c-\\x1f, que str.strip()/isspace() y el \\s de un patrón str consideran espacio
+y sus equivalentes en bytes no.
+"""
+import codecs
+import mmap
+import sys
+
+_SEPARADORES = (b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+_CHUNK = 1 << 20  # Tamaño de bloque (bytes) al recorrer el mmap
+
+
+def es_ascii_simple(datos) -> bool:
+    return datos.isascii() and not any(sep in datos for sep in _SEPARADORES)
+
+
+def read_lines(filepath: str):
+    """
+    Lee todas las líneas de un fichero usando utf-8-sig (eliminando BOM) o Latin-1.
+    Devuelve una lista de líneas sin salto final.
+    """
+    for enc in ("utf-8-sig", "latin-1"):
+        try:
+            with open(filepath, encoding=enc) as f:
+                return [line.rstrip("\n") for line in f]
+        except UnicodeDecodeError:
+            continue
+        except FileNotFoundError:
+            print(f"ERROR: No se encontró el fichero '{filepath}'", file=sys.stderr)
+            sys.exit(1)
+    print(f"ERROR: No se pudo leer '{filepath}' en utf-8-sig ni latin-1.", file=sys.stderr)
+    sys.exit(1)
+
+
+def libera_paginas(buf, start: int, end: int):
+    """Devuelve al sistema las páginas ya leídas del mmap (el fichero no se carga entero en RAM)."""
+    if hasattr(mmap, "MADV_DONTNEED"):
+        page = start - start % mmap.PAGESIZE
+        buf.madvise(mmap.MADV_DONTNEED, page, end - page)
+
+
+def detect_encoding(buf) -> str:
+    """
+    Mismo criterio que read_lines: 'utf-8-sig' si todo el fichero es UTF-8 válido,
+    si no 'latin-1'. Recorre el buffer por bloques; los bloques ASCII se saltan.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for start in range(0, len(buf), _CHUNK):
+            chunk = buf[start:start + _CHUNK]
+            libera_paginas(buf, start, start + len(chunk))
+            if chunk.isascii() and not decoder.getstate()[0]:
+                continue
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8-sig"
+
+
+def codificacion_lineas(buf):
+    """
+    (codificación de cada línea, posición de la primera línea) según detect_encoding:
+    con UTF-8 el BOM inicial se salta y las líneas se decodifican en 'utf-8'.
+    """
+    encoding = detect_encoding(buf)
+    if encoding != "utf-8-sig":
+        return encoding, 0
+    return "utf-8", 3 if buf[:3] == codecs.BOM_UTF8 else 0
+
+
+def trozos(buf, start: int, paso: int):
+    """Rangos (inicio, fin) de buf desde 'start', de al menos 'paso' bytes y cortados en fin de línea."""
+    while start < len(buf):
+        end = buf.find(b"\n", start + paso)
+        end = len(buf) if end < 0 else end + 1
+        yield start, end
+        start = end
+
+
+def stream_lines(filepath: str):
+    """
+    Recorre el fichero con mmap y devuelve las líneas una a una, sin salto final y
+    con los mismos cortes que el modo texto (\\n, \\r\\n y \\r). Las líneas ASCII se
+    devuelven como bytes, sin decodificar; el resto como str, decodificadas con la
+    codificación que habría usado read_lines.
+    El fichero se procesa por bloques de _CHUNK bytes cortados en fin de línea: un
+    bloque sin bytes especiales se parte entero en C, y las páginas ya leídas se
+    liberan, así que la memoria residente no crece con el fichero.
+    """
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        print(f"ERROR: No se encontró el fichero '{filepath}'", file=sys.stderr)
+        sys.exit(1)
+    with f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # fichero vacío
+            return
+        with buf:
+            line_encoding, start = codificacion_lineas(buf)
+            yield from lineas_desde(buf, start, line_encoding)
+
+
+def lineas_desde(buf, start: int, line_encoding: str):
+    """
+    Recorre buf desde 'start' (inicio de línea) por bloques de _CHUNK bytes,
+    liberando las páginas ya leídas.
+    """
+    for start, end in trozos(buf, start, _CHUNK):
+        block = buf[start:end]
+        libera_paginas(buf, start, end)
+        yield from lineas_bloque(block, line_encoding)
+
+
+def lineas_bloque(block: bytes, line_encoding: str):
+    """
+    Parte un bloque de bytes que empieza en inicio de línea con las mismas reglas
+    que stream_lines: líneas ASCII como bytes y el resto decodificadas.
+    """
+    lineas = block.split(b"\n")
+    if block.endswith(b"\n"):
+        lineas.pop()
+    if b"\r" in block:
+        # \r\n cuenta como un solo salto y un \r suelto también corta la línea
+        lineas = [parte for linea in lineas
+                  for parte in (linea[:-1] if linea.endswith(b"\r") else linea).split(b"\r")]
+    if es_ascii_simple(block):
+        yield from lineas
+        return
+    for linea in lineas:
+        if es_ascii_simple(linea):
+            yield linea
+        else:
+            yield linea.decode(line_encoding)
@@ -0,0 +1,80 @@
+"""
+Regression test for crawl_queue with the DNS prefilter on: the last sites of the
+queue (fewer than LIVENESS_BATCH) must still be crawled instead of waiting forever.
+Browsers and DNS are stubbed, so this runs without Chrome or network.
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import emailcrawlerGUI  # noqa: E402
+from emailcrawlerGUI import DriverManager, JobQueue, LivenessChecker, crawl_queue  # noqa: E402
+
+
+class StubDriver:
+    """Every page shows info@<host>."""
+
+    def __init__(self, headless=False, lean=False):
+        self.url = ""
+
+    def get(self, url):
+        self.url = url
+
+    def execute_script(self, script, *args):
+        email = f"info@{emailcrawlerGUI.get_domain(self.url)}"
+        if script is emailcrawlerGUI._PAGE_STATE_JS:
+            return ["complete", 1000, [email]]
+        if script is emailcrawlerGUI._EXTRACT_EMAILS_JS:
+            return [[email, "text"]]
+        return [] if "querySelectorAll" in script else 0
+
+    @property
+    def page_source(self):
+        return f"<p>info@{emailcrawlerGUI.get_domain(self.url)}</p>"
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class StubResolver:
+    async def resolve(self, host, rdtype):
+        return ["192.0.2.1"] if rdtype == "A" else []
+
+
+def test_partial_dns_batch_is_crawled(tmp_path, monkeypatch):
+    monkeypatch.setattr(emailcrawlerGUI, "JOB_POLL_SECONDS", 0.1)
+    jobs = JobQueue(str(tmp_path / "jobs.sqlite3"))
+    jobs.add([f"https://site{n}.example" for n in range(10)])
+    results = []
+    run = threading.Thread(target=crawl_queue, daemon=True, args=(jobs,), kwargs=dict(
+        worker="w1", num_workers=2, http_first=False, on_result=lambda *a: results.append(a),
+        liveness=LivenessChecker(resolver=StubResolver()), drivers=DriverManager(factory=StubDriver),
+    ))
+    run.start()
+    run.join(timeout=30)
+    assert not run.is_alive(), jobs.counts()
+    assert jobs.counts() == {"pending": 0, "leased": 0, "done": 10}
+    assert len(results) == 10 and all(result for _, _, result, _ in results)
+
+
+def test_partial_dns_batch_is_not_held_while_waiting_for_others(tmp_path, monkeypatch):
+    monkeypatch.setattr(emailcrawlerGUI, "JOB_POLL_SECONDS", 0.1)
+    monkeypatch.setattr(emailcrawlerGUI, "JOB_HEARTBEAT_SECONDS", 0.2)
+    jobs = JobQueue(str(tmp_path / "jobs.sqlite3"), lease_seconds=3)
+    jobs.add([f"https://site{n}.example" for n in range(11)])
+    # Another worker leases one site and disappears: it only comes back once its lease expires
+    assert len(jobs.claim("w0")) == 1
+    done = []
+    start = time.monotonic()
+    crawl_queue(jobs, worker="w1", num_workers=2, http_first=False,
+                on_result=lambda *a: done.append(time.monotonic() - start),
+                liveness=LivenessChecker(resolver=StubResolver()), drivers=DriverManager(factory=StubDriver))
+    assert jobs.counts() == {"pending": 0, "leased": 0, "done": 11}
+    # The ten free sites finish long before the abandoned lease runs out
+    assert len(done) == 11 and sorted(done)[9] < 2
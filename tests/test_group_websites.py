@@ -0,0 +1,33 @@
+"""Grouping of input lines into sites: only www. and plain pages are folded together."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from emailcrawlerGUI import ResultCache, group_websites  # noqa: E402
+
+
+def test_same_site_is_crawled_once():
+    targets, members = group_websites(["http://www.acme.com/", "https://acme.com", "acme.com/about"])
+    assert targets == ["http://www.acme.com"] and members == [[0, 1, 2]]
+
+
+def test_unrelated_leads_are_not_merged():
+    lines = ["https://acme-plumbing.wordpress.com", "https://joes-bakery.wordpress.com",
+             "https://shop.acme.com", "https://acme.com",
+             "https://www.facebook.com/acme", "facebook.com/joes"]
+    targets, members = group_websites(lines)
+    assert members == [[i] for i in range(len(lines))]
+    assert targets[4] == "https://www.facebook.com/acme"
+
+
+def test_path_that_names_the_business_is_kept():
+    targets, _ = group_websites(["https://sites.google.com/view/acme-dental/"])
+    assert targets == ["https://sites.google.com/view/acme-dental"]
+
+
+def test_cache_is_per_site(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("https://acme-plumbing.wordpress.com", [("info@acme-plumbing.com", "web")])
+    assert cache.get("https://joes-bakery.wordpress.com") is None
+    assert cache.get("http://acme-plumbing.wordpress.com/about") == [("info@acme-plumbing.com", "web")]
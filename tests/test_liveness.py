@@ -0,0 +1,36 @@
+"""LivenessChecker with a stub resolver: MX and the fallback A/AAAA go to the registrable domain."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from emailcrawlerGUI import LivenessChecker  # noqa: E402
+
+
+class StubResolver:
+    def __init__(self, records):
+        self.records = records
+        self.lookups = []
+
+    async def resolve(self, host, rdtype):
+        self.lookups.append((host, rdtype))
+        answer = self.records.get((host, rdtype), [])
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def test_host_without_records_of_a_live_domain_is_alive():
+    resolver = StubResolver({("acme.com", "A"): ["192.0.2.1"], ("acme.com", "MX"): ["10 mail.acme.com."]})
+    assert LivenessChecker(resolver=resolver).check_many(["http://www.acme.com/"]) == ["alive"]
+    assert ("acme.com", "MX") in resolver.lookups and ("www.acme.com", "MX") not in resolver.lookups
+
+
+def test_mx_only_domain_is_alive():
+    resolver = StubResolver({("acme.com", "MX"): ["10 mail.acme.com."]})
+    assert LivenessChecker(resolver=resolver).check_many(["https://www.acme.com"]) == ["alive"]
+
+
+def test_dead_only_when_host_and_domain_are_empty():
+    checker = LivenessChecker(resolver=StubResolver({("gone.com", "A"): TimeoutError()}))
+    assert checker.check_many(["https://www.nothing.com", "https://www.gone.com"]) == ["dead", "unknown"]
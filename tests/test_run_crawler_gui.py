@@ -0,0 +1,38 @@
+"""run_crawler_gui always posts "done", so a failed run doesn't leave Start disabled."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import emailcrawlerGUI  # noqa: E402
+from emailcrawlerGUI import EmailCrawlerGUI  # noqa: E402
+
+
+class StubGUI:
+    targets = ["http://acme.com/"]
+    websites = ["http://acme.com/"]
+    target_members = [[0]]
+    drivers = None
+
+    def __init__(self):
+        self.events = []
+
+    def post(self, kind, *args):
+        self.events.append((kind,) + args)
+
+    def log(self, text, tag=None):
+        self.post("log", text, tag)
+
+    def set_worker_status(self, worker_id, text):
+        pass
+
+
+def test_done_is_posted_when_setup_raises(monkeypatch):
+    def broken_cache(*args, **kwargs):
+        raise OSError("cache is locked")
+
+    monkeypatch.setattr(emailcrawlerGUI, "ResultCache", broken_cache)
+    gui = StubGUI()
+    EmailCrawlerGUI.run_crawler_gui(gui, True, [], [], False, cache_ttl=60)
+    assert gui.events[-1] == ("done",)
+    assert any(kind == "log" and "cache is locked" in args[0] for kind, *args in gui.events)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+vistos_aba.py
+
+Conjunto de ABA ya vistos, para el control de duplicados de los scripts ABA
+(TEMP1, TEMP11, TEMP2, TEMP22 y abaCLI).
+
+Empieza como un set() normal y, al superar UMBRAL_MAPA valores distintos, pasa a
+un mapa de 10^9 bits (125 MB) sobre memoria anónima (mmap), un bit por ABA de 9
+dígitos. El sistema solo reserva las páginas que se llegan a tocar, pero cada ABA
+aleatorio toca su propia página de 4 KB, así que con pocos ABA distintos el mapa
+gasta más y va más lento que el set (bench_aba_dedup.py):
+
+    distintos      set()              mapa de bits
+    20 mil         ~2 MB,  0.14 us    ~57 MB,  1.1 us   por registro
+    2 millones     176 MB, 1.2 us     119 MB,  2.8 us   por registro
+
+El set gasta unos 100 bytes por ABA distinto y el mapa nunca pasa de 125 MB, así
+que el mapa solo ahorra memoria a partir de ~1.2 millones de ABA distintos; el
+cambio se hace en 1 millón, cuando el set ya ocupa ~100 MB.
+
+Cualquier otro valor (vacío, longitud distinta, dígitos no ASCII...) se queda en el
+set, así que el resultado es siempre el mismo que con set().
+"""
+import mmap
+
+ABA_DIGITOS = 9
+_BYTES_MAPA = 10 ** ABA_DIGITOS // 8
+UMBRAL_MAPA = 1_000_000  # ABA distintos a partir de los cuales se pasa al mapa de bits
+
+
+class VistosABA(set):
+    """
+    Sustituto de set() para ABA: admite 'aba in vistos', vistos.add(aba),
+    vistos.update(abas) y len(vistos). Mientras es un set, 'in' es el de set (en C);
+    al superar 'umbral' valores distintos la instancia pasa a _VistosMapa.
+    Con umbral=0 usa el mapa desde el principio.
+    """
+
+    mapa = None
+
+    def __init__(self, abas=(), umbral=UMBRAL_MAPA):
+        super().__init__()
+        self.umbral = umbral
+        if umbral <= 0:
+            self.a_mapa()
+        self.update(abas)
+
+    def add(self, aba):
+        set.add(self, aba)
+        if set.__len__(self) > self.umbral:
+            self.a_mapa()
+
+    def update(self, abas):
+        for aba in abas:
+            self.add(aba)
+
+    def a_mapa(self):
+        """Pasa los ABA de 9 dígitos al mapa de bits; el resto sigue en el set."""
+        valores = list(self)
+        self.clear()
+        # Memoria anónima: se lee como ceros y solo ocupa RAM lo que se escribe
+        self.mapa = mmap.mmap(-1, _BYTES_MAPA)
+        self.total = 0
+        self.__class__ = _VistosMapa
+        self.update(valores)
+
+    def close(self):
+        pass
+
+
+class _VistosMapa(VistosABA):
+    """VistosABA ya en modo mapa de bits: el set solo guarda los valores que no son ABA."""
+
+    # _bit va repetido dentro de __contains__ y add: es el camino caliente y una
+    # llamada más por registro se nota en ficheros de decenas de millones de líneas
+
+    def __contains__(self, aba):
+        if len(aba) != ABA_DIGITOS or not aba.isascii() or not aba.isdigit():
+            return set.__contains__(self, aba)
+        n = int(aba)
+        return bool(self.mapa[n >> 3] & (1 << (n & 7)))
+
+    def add(self, aba):
+        if len(aba) != ABA_DIGITOS or not aba.isascii() or not aba.isdigit():
+            if not set.__contains__(self, aba):
+                set.add(self, aba)
+                self.total += 1
+            return
+        n = int(aba)
+        byte = n >> 3
+        mascara = 1 << (n & 7)
+        valor = self.mapa[byte]
+        if not valor & mascara:
+            self.mapa[byte] = valor | mascara
+            self.total += 1
+
+    def a_mapa(self):
+        pass
+
+    def __len__(self):
+        return self.total
+
+    def close(self):
+        self.mapa.close()